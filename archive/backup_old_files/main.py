@@ -4,11 +4,68 @@ import pygame
 import sys
 import math
 import pygame.gfxdraw # For AA
-from collections import deque
+from array import array
+from bisect import bisect_left
+from functools import lru_cache
 #from typing import Tuple, Optional
 
+# Event types the app reacts to; SDL drops everything else (mouse motion
+# included) before queueing it. WINDOWEXPOSED triggers a full redraw when part
+# of the window has to be repainted.
+HANDLED_EVENTS = [pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN,
+                  pygame.MOUSEBUTTONUP, pygame.WINDOWEXPOSED]
+
+@lru_cache(maxsize=None)
+def get_font(size):
+    """Get the shared default font for a size, loading it on first use."""
+    return pygame.font.Font(None, size)
+
+@lru_cache(maxsize=None)
+def _load_ball_image():
+    """Load the ball image from disk once."""
+    return pygame.image.load("assets/circle.png")
+
+@lru_cache(maxsize=None)
+def get_ball_texture(size):
+    """Get the ball image scaled to (width, height), shared by every ball of that size."""
+    texture = pygame.transform.scale(_load_ball_image(), size)
+    # Match the display's pixel format once so blits need no conversion
+    if pygame.display.get_surface() is not None:
+        texture = texture.convert_alpha()
+    return texture
+
+@lru_cache(maxsize=None)
+def get_shadow_surface(radius):
+    """Get the ball shadow ellipse for a radius, drawn once at full opacity."""
+    shadow = pygame.Surface((radius * 2 + 1, 11), pygame.SRCALPHA)
+    pygame.gfxdraw.filled_ellipse(shadow, radius, 5, radius, 5, (0, 0, 0))
+    if pygame.display.get_surface() is not None:
+        shadow = shadow.convert_alpha()
+    return shadow
+
+# Rendered text surfaces keyed by (font id, text, color). Most labels repeat
+# every frame, so only text that actually changed goes through font.render
+_text_cache = {}
+_TEXT_CACHE_SIZE = 256
+
+def _render_cached(font, text, color):
+    """Render antialiased text, reusing the surface from an earlier call."""
+    key = (id(font), text, color)
+    # Re-inserting on every call keeps the dict in least-recently-used order
+    surface = _text_cache.pop(key, None)
+    if surface is None:
+        surface = font.render(text, True, color)
+        if len(_text_cache) >= _TEXT_CACHE_SIZE:
+            # Evict the least recently used entry
+            del _text_cache[next(iter(_text_cache))]
+    _text_cache[key] = surface
+    return surface
+
 class GUIElement:
     """Base class for GUI elements."""
+    # Event types handle_event() responds to
+    EVENT_TYPES = ()
+    
     def __init__(self, x, y, width, height):
         self.rect = pygame.Rect(x, y, width, height)
         self.active = False
@@ -25,15 +82,30 @@ class GUIElement:
     def draw(self, screen):
         """Draw the element."""
         pass
+    
+    def get_draw_rect(self):
+        """Get the screen area draw() covers."""
+        return self.rect
 
 class Button(GUIElement):
     """A clickable button."""
+    EVENT_TYPES = (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP)
+    
     def __init__(self, x, y, width, height, text, callback=None):
         super().__init__(x, y, width, height)
         self.text = text
         self.callback = callback
-        self.font = pygame.font.Font(None, 24)
+        self.font = get_font(24)
         self.pressed = False
+    
+    @property
+    def text(self):
+        return self._text
+    
+    @text.setter
+    def text(self, text):
+        self._text = text
+        self._text_dirty = True
         
     def handle_event(self, event):
         if not self.visible:
@@ -63,22 +135,39 @@ class Button(GUIElement):
         pygame.draw.rect(screen, color, self.rect)
         pygame.draw.rect(screen, border_color, self.rect, 2)
         
-        # Center text
-        text_surface = self.font.render(self.text, True, (255, 255, 255))
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        screen.blit(text_surface, text_rect)
+        # Center text, rendered again only after the text changed
+        self._layout_text()
+        screen.blit(self._text_surface, self._text_rect)
+    
+    def _layout_text(self):
+        """Render and place the text if it changed since the last call."""
+        if self._text_dirty:
+            self._text_surface = _render_cached(self.font, self.text, (255, 255, 255))
+            self._text_rect = self._text_surface.get_rect(center=self.rect.center)
+            self._text_dirty = False
+    
+    def get_draw_rect(self):
+        """Get the screen area draw() covers, including text wider than the button."""
+        self._layout_text()
+        return self.rect.union(self._text_rect)
 
 class InputField(GUIElement):
     """A text input field."""
+    EVENT_TYPES = (pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN)
+    
     def __init__(self, x, y, width, height, placeholder="", max_length=20):
         super().__init__(x, y, width, height)
         self.text = ""
         self.placeholder = placeholder
         self.max_length = max_length
-        self.font = pygame.font.Font(None, 20)
+        self.font = get_font(20)
         self.cursor_pos = 0
         self.cursor_visible = True
         self.cursor_timer = 0
+        self._text_key = None  # (text, color) the cached blit was placed for
+        self._text_blit = None
+        self._prefix_widths = [0]  # Width of text[:i] for each cursor position i
+        self._measured_text = ""
         
     def handle_event(self, event):
         if not self.visible:
@@ -133,35 +222,54 @@ class InputField(GUIElement):
         display_text = self.text if self.text else self.placeholder
         text_color = (0, 0, 0) if self.text else (128, 128, 128)
         
-        text_surface = self.font.render(display_text, True, text_color)
-        text_rect = text_surface.get_rect()
-        text_rect.centery = self.rect.centery
-        text_rect.x = self.rect.x + 5
-        
-        # Clip text to field
-        clip_rect = self.rect.copy()
-        clip_rect.width -= 10
-        screen.set_clip(clip_rect)
-        screen.blit(text_surface, text_rect)
-        screen.set_clip(None)
+        # Place the text once per change; blitting only the part inside the
+        # field clips it without touching the screen's clip
+        text_key = (display_text, text_color)
+        if text_key != self._text_key:
+            text_surface = _render_cached(self.font, display_text, text_color)
+            text_rect = text_surface.get_rect()
+            text_rect.centery = self.rect.centery
+            text_rect.x = self.rect.x + 5
+            
+            clip_rect = self.rect.copy()
+            clip_rect.width -= 10
+            visible = text_rect.clip(clip_rect)
+            area = visible.move(-text_rect.x, -text_rect.y)
+            self._text_key = text_key
+            self._text_blit = (text_surface, visible, area)
+        screen.blit(*self._text_blit)
         
         # Cursor
         if self.active and self.cursor_visible and self.text:
-            cursor_text = self.text[:self.cursor_pos]
-            cursor_width = self.font.size(cursor_text)[0]
-            cursor_x = self.rect.x + 5 + cursor_width
+            if self._measured_text != self.text:
+                # Measure whole prefixes so kerning matches the rendered text
+                self._prefix_widths = [self.font.size(self.text[:i])[0]
+                                       for i in range(len(self.text) + 1)]
+                self._measured_text = self.text
+            cursor_x = self.rect.x + 5 + self._prefix_widths[self.cursor_pos]
             cursor_y1 = self.rect.y + 3
             cursor_y2 = self.rect.y + self.rect.height - 3
             pygame.draw.line(screen, (0, 0, 0), (cursor_x, cursor_y1), (cursor_x, cursor_y2), 1)
 
 class Checkbox(GUIElement):
     """A checkbox element."""
+    EVENT_TYPES = (pygame.MOUSEBUTTONDOWN,)
+    
     def __init__(self, x, y, size, text, checked=False, callback=None):
         super().__init__(x, y, size, size)
         self.text = text
         self.checked = checked
         self.callback = callback
-        self.font = pygame.font.Font(None, 20)
+        self.font = get_font(20)
+    
+    @property
+    def text(self):
+        return self._text
+    
+    @text.setter
+    def text(self, text):
+        self._text = text
+        self._text_dirty = True
         
     def handle_event(self, event):
         if not self.visible:
@@ -195,12 +303,23 @@ class Checkbox(GUIElement):
             ]
             pygame.draw.lines(screen, (0, 150, 0), False, points, 3)
         
-        # Text
-        text_surface = self.font.render(self.text, True, (255, 255, 255))
-        text_rect = text_surface.get_rect()
-        text_rect.centery = self.rect.centery
-        text_rect.x = self.rect.right + 10
-        screen.blit(text_surface, text_rect)
+        # Text, rendered again only after the text changed
+        self._layout_text()
+        screen.blit(self._text_surface, self._text_rect)
+    
+    def _layout_text(self):
+        """Render and place the label if it changed since the last call."""
+        if self._text_dirty:
+            self._text_surface = _render_cached(self.font, self.text, (255, 255, 255))
+            self._text_rect = self._text_surface.get_rect()
+            self._text_rect.centery = self.rect.centery
+            self._text_rect.x = self.rect.right + 10
+            self._text_dirty = False
+    
+    def get_draw_rect(self):
+        """Get the screen area draw() covers, label included."""
+        self._layout_text()
+        return self.rect.union(self._text_rect)
 
 class Ball:
     """A physics-based ball object with vertical motion simulation."""
@@ -223,10 +342,9 @@ class Ball:
         
         # Load ball texture
         try:
-            self.texture = pygame.image.load("assets/circle.png")
             # Scale texture to match radius
             scaled_size = (int(radius * 2), int(radius * 2))
-            self.texture = pygame.transform.scale(self.texture, scaled_size)
+            self.texture = get_ball_texture(scaled_size)
         except (pygame.error, FileNotFoundError, OSError):
             print("Warning: Could not load circle.png, using default circle")
             self.texture = None
@@ -257,14 +375,29 @@ class Ball:
             if abs(self.velocity_y) < 50:
                 self.velocity_y = 0
                 
+    def get_draw_rect(self):
+        """Get the screen area draw() covers, shadow included."""
+        center = (int(self.x), int(self.y))
+        if self.texture:
+            rect = self.texture.get_rect(center=center)
+        else:
+            radius = int(self.radius)
+            rect = pygame.Rect(center[0] - radius, center[1] - radius, radius * 2 + 1, radius * 2 + 1)
+        shadow_rect = pygame.Rect(int(self.x) - int(self.radius), 595, int(self.radius) * 2 + 1, 11)
+        return rect.union(shadow_rect)
+    
     def draw(self, screen):
         """Draw the ball on the screen."""
         # Draw a simple shadow
         shadow_y = 600  # Ground level
         shadow_alpha = max(0, 100 - int(abs(self.y - 600) / 2))
         if shadow_alpha > 0:
-            shadow_color = (0, 0, 0, shadow_alpha)
-            pygame.gfxdraw.filled_ellipse(screen, int(self.x), shadow_y, int(self.radius), 5, shadow_color)
+            # Only the alpha changes between frames, so blit a cached opaque
+            # ellipse faded with the surface alpha
+            radius = int(self.radius)
+            shadow = get_shadow_surface(radius)
+            shadow.set_alpha(shadow_alpha)
+            screen.blit(shadow, (int(self.x) - radius, shadow_y - 5))
             
         # Draw the ball texture or a fallback circle
         if self.texture:
@@ -296,15 +429,29 @@ class PhysicsSimulation:
         pygame.init()
         self.screen = pygame.display.set_mode((width, height))
         pygame.display.set_caption("Vertical Ball Physics Simulation")
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(HANDLED_EVENTS)
         self.clock = pygame.time.Clock()
         
         # Create ball
         self.ball = Ball(width // 2, 100)
         
         # UI properties
-        self.font = pygame.font.Font(None, 24)
-        self.small_font = pygame.font.Font(None, 20)
+        self.font = get_font(24)
+        self.small_font = get_font(20)
         self.show_info = True
+        
+        # Info text composed into one surface, rebuilt only when a shown value changes
+        self._info_signature = None
+        self._info_surface = None
+        # Controls help block, composed once per step unit
+        self._controls_surfaces = {}
+        
+        # Dirty-rect drawing: any event forces the next frame to be drawn in full;
+        # otherwise only what changed since the last frame is redrawn
+        self._full_redraw = True
+        self._prev_ball_rect = None
+        self._prev_info_surface = None
 
         # Time control properties
         self.simulation_time = 0.0  # Simulation time in seconds
@@ -313,9 +460,15 @@ class PhysicsSimulation:
         self.dt = 1 / self.target_fps  # Fixed time step for consistent physics
         self.auto_pause_after_step = False
 
-        # State management - using deque for efficient operations at both ends
-        self.history = deque(maxlen=500)  # Store up to 500 frames of history (about 3.5 seconds at 144 FPS)
-        self.time_history = deque(maxlen=500)  # Store corresponding time values
+        # State management - a preallocated ring of saved frames, one array per field
+        self.max_history_frames = 500  # About 3.5 seconds at 144 FPS
+        self._hist_time = array('d', [0.0]) * self.max_history_frames
+        self._hist_x = array('d', [0.0]) * self.max_history_frames
+        self._hist_y = array('d', [0.0]) * self.max_history_frames
+        self._hist_vy = array('d', [0.0]) * self.max_history_frames
+        self._hist_ay = array('d', [0.0]) * self.max_history_frames
+        self._hist_head = 0  # Slot the next frame is written to
+        self._hist_count = 0
         self.rewind_speed = 5  # Number of frames to rewind per button press
 
         # GUI elements
@@ -379,6 +532,17 @@ class PhysicsSimulation:
         self.auto_pause_checkbox = Checkbox(panel_x, y_offset, 20, "Auto-pause after step", 
                                           self.auto_pause_after_step, self.toggle_auto_pause)
         self.gui_elements.append(self.auto_pause_checkbox)
+        
+        # Widgets by the event types they respond to, in dispatch order
+        self._event_handlers = {}
+        for element in self.gui_elements:
+            for event_type in element.EVENT_TYPES:
+                self._event_handlers.setdefault(event_type, []).append(element)
+        
+        # Clicks are hit-tested against all widget rects in one call
+        self._gui_rects = [element.rect for element in self.gui_elements]
+        self._input_fields = [element for element in self.gui_elements
+                              if isinstance(element, InputField)]
 
     def create_label(self, text, x, y):
         """Helper to create text labels (not interactive)."""
@@ -432,22 +596,15 @@ class PhysicsSimulation:
         if frame_count > 0:
             # Step forward
             for _ in range(frame_count):
-                self.save_state()
-                self.ball.update(self.dt, self.ground_y)
-                self.ball.check_ground_collision(self.ground_y)
-                self.simulation_time += self.dt
+                self.advance_frame()
         elif frame_count < 0:
             # Step backward (rewind)
-            frames_to_rewind = min(abs(frame_count), len(self.history))
-            for _ in range(frames_to_rewind):
-                if self.history and self.time_history:
-                    self.history.pop()
-                    self.time_history.pop()
+            frames_to_rewind = min(abs(frame_count), self._hist_count)
+            self._truncate_history(self._hist_count - frames_to_rewind)
             
             # Apply the rewound state
-            if self.history and self.time_history:
-                self.ball.set_state(self.history[-1])
-                self.simulation_time = self.time_history[-1]
+            if self._hist_count:
+                self.restore_newest_frame()
             else:
                 # If we've exhausted history, reset to initial state
                 self.reset_simulation()
@@ -462,10 +619,7 @@ class PhysicsSimulation:
             # Step forward in time
             steps = int(time_step / self.dt)
             for _ in range(steps):
-                self.save_state()
-                self.ball.update(self.dt, self.ground_y)
-                self.ball.check_ground_collision(self.ground_y)
-                self.simulation_time += self.dt
+                self.advance_frame()
         elif time_step < 0:
             # Step backward in time
             target_time = max(0, self.simulation_time + time_step)  # Can't go below 0
@@ -513,48 +667,96 @@ class PhysicsSimulation:
 
     def rewind_to_time(self, target_time):
         """Rewind to the closest available time in history."""
-        if not self.time_history:
+        if not self._hist_count:
             self.reset_simulation()
             return
         
-        # Find the closest time in history
-        best_idx = 0
-        best_diff = abs(self.time_history[0] - target_time)
-        
-        for i, t in enumerate(self.time_history):
-            diff = abs(t - target_time)
-            if diff < best_diff:
-                best_diff = diff
-                best_idx = i
+        # Find the closest time in history; on a tie the earliest frame wins
+        best_idx = self._search_time(target_time)
+        if best_idx == self._hist_count or (
+                best_idx > 0 and
+                target_time - self._time_at(best_idx - 1) <= self._time_at(best_idx) - target_time):
+            # A rewound frame is saved again when stepping resumes, so times
+            # can repeat; go back to the first frame with this time
+            best_idx = self._search_time(self._time_at(best_idx - 1))
         
         # Rewind to that state
-        frames_to_rewind = len(self.history) - best_idx - 1
-        if frames_to_rewind > 0:
-            for _ in range(frames_to_rewind):
-                if self.history and self.time_history:
-                    self.history.pop()
-                    self.time_history.pop()
-        
-        if self.history and self.time_history:
-            self.ball.set_state(self.history[-1])
-            self.simulation_time = self.time_history[-1]
+        self._truncate_history(best_idx + 1)
+        self.restore_newest_frame()
+
+    def advance_frame(self):
+        """Save the current state, then advance the simulation by one frame."""
+        self.save_state()
+        ball = self.ball
+        # A ball resting on the ground without acceleration stays exactly
+        # where it is, so its update and collision check can be skipped
+        if not (ball.velocity_y == 0 and ball.acceleration_y == 0 and
+                ball.y + ball.radius >= self.ground_y):
+            ball.update(self.dt, self.ground_y)
+            ball.check_ground_collision(self.ground_y)
+        self.simulation_time += self.dt
 
     def save_state(self):
         """Save the current state of the ball to history."""
-        state = self.ball.get_state()
-        self.history.append(state)
-        self.time_history.append(self.simulation_time)
+        head = self._hist_head
+        ball = self.ball
+        self._hist_time[head] = self.simulation_time
+        self._hist_x[head] = ball.x
+        self._hist_y[head] = ball.y
+        self._hist_vy[head] = ball.velocity_y
+        self._hist_ay[head] = ball.acceleration_y
+        self._hist_head = (head + 1) % self.max_history_frames
+        if self._hist_count < self.max_history_frames:
+            self._hist_count += 1
+
+    def restore_newest_frame(self):
+        """Put the ball and clock back to the newest saved frame."""
+        slot = self._history_slot(-1)
+        self.ball.set_state((self._hist_x[slot], self._hist_y[slot],
+                             self._hist_vy[slot], self._hist_ay[slot]))
+        self.simulation_time = self._hist_time[slot]
+
+    def _history_slot(self, index):
+        """Map a history index (0 is oldest, -1 is newest) to its ring slot."""
+        if index < 0:
+            index += self._hist_count
+        return (self._hist_head - self._hist_count + index) % self.max_history_frames
+
+    def _time_at(self, index):
+        """Get the simulation time of a saved frame."""
+        return self._hist_time[self._history_slot(index)]
+
+    def _truncate_history(self, count):
+        """Keep only the oldest `count` saved frames."""
+        self._hist_head = (self._hist_head - self._hist_count + count) % self.max_history_frames
+        self._hist_count = count
+
+    def _search_time(self, target_time):
+        """Find the first saved frame at or after a time (the frame count if there is none).
+
+        Saved times increase from oldest to newest, so the ring is searched as
+        two sorted runs: from the oldest slot to the end of the buffer, then
+        from the start of the buffer.
+        """
+        times = self._hist_time
+        start = self._history_slot(0)
+        first_run = min(self._hist_count, self.max_history_frames - start)
+        
+        index = bisect_left(times, target_time, start, start + first_run) - start
+        if index < first_run:
+            return index
+        return first_run + bisect_left(times, target_time, 0, self._hist_count - first_run)
 
     def can_rewind(self):
         """Check if there are states available for rewinding."""
-        return len(self.history) > 1
+        return self._hist_count > 1
 
     def get_history_info(self):
         """Get information about the current history state."""
         return {
-            'frames_stored': len(self.history),
-            'max_frames': self.history.maxlen,
-            'time_stored_seconds': len(self.history) / self.target_fps,
+            'frames_stored': self._hist_count,
+            'max_frames': self.max_history_frames,
+            'time_stored_seconds': self._hist_count / self.target_fps,
             'can_rewind': self.can_rewind()
         }
 
@@ -586,30 +788,9 @@ class PhysicsSimulation:
         """Draw UI information."""
         if not self.show_info:
             return
-            
-        # Physics info (left side)
-        height_above_ground = max(0, self.ground_y - (self.ball.y + self.ball.radius))
-        kinetic_energy = 0.5 * self.ball.mass * self.ball.velocity_y**2
-        potential_energy = self.ball.mass * self.ball.gravity * height_above_ground
-        total_energy = kinetic_energy + potential_energy
         
-        # Get history info
-        history_info = self.get_history_info()
-        
-        info_lines = [
-            f"Time: {self.simulation_time:.3f} s",
-            f"Position: ({self.ball.x:.1f}, {self.ball.y:.1f}) px",
-            f"Velocity: {self.ball.velocity_y:.1f} px/s",
-            f"Acceleration: {self.ball.acceleration_y:.1f} px/s²",
-            f"Energy: {total_energy:.0f} J",
-            f"Status: {'Playing' if self.is_playing else 'Paused'}",
-            f"Step Mode: {'Frames' if self.step_by_frames else 'Seconds'}",
-            f"History: {history_info['frames_stored']}/{history_info['max_frames']} frames"
-        ]
-        
-        for i, line in enumerate(info_lines):
-            text = self.font.render(line, True, (255, 255, 255))
-            self.screen.blit(text, (10, 10 + i * 25))
+        # draw() refreshes the info surface before drawing the scene
+        self.screen.blit(self._info_surface, (10, 10))
         
         # Control panel labels
         panel_x = self.width - 240
@@ -617,19 +798,78 @@ class PhysicsSimulation:
         # Step value label with unit indication
         step_unit = "frames" if self.step_by_frames else "seconds"
         step_label_text = f"Step Value ({step_unit}):"
-        label = self.small_font.render(step_label_text, True, (200, 200, 200))
+        label = _render_cached(self.small_font, step_label_text, (200, 200, 200))
         self.screen.blit(label, (panel_x, 145))
         
         # Helper text for negative values
         helper_text = "(+/- values allowed)"
-        helper_label = self.small_font.render(helper_text, True, (150, 150, 150))
+        helper_label = _render_cached(self.small_font, helper_text, (150, 150, 150))
         self.screen.blit(helper_label, (panel_x, 165))
         
         # Set time label
-        label = self.small_font.render("Set Time (s):", True, (200, 200, 200))
+        label = _render_cached(self.small_font, "Set Time (s):", (200, 200, 200))
         self.screen.blit(label, (panel_x, 275))
         
         # Controls info (bottom left)
+        controls_surface = self._controls_surfaces.get(step_unit)
+        if controls_surface is None:
+            controls_surface = self.render_controls_block(step_unit)
+            self._controls_surfaces[step_unit] = controls_surface
+        self.screen.blit(controls_surface, (10, self.height - 160))
+    
+    def refresh_info_surface(self):
+        """Rebuild the physics info surface if a shown value changed."""
+        # Physics info (left side)
+        height_above_ground = max(0, self.ground_y - (self.ball.y + self.ball.radius))
+        kinetic_energy = 0.5 * self.ball.mass * self.ball.velocity_y**2
+        potential_energy = self.ball.mass * self.ball.gravity * height_above_ground
+        total_energy = kinetic_energy + potential_energy
+        
+        # Get history info
+        history_info = self.get_history_info()
+        
+        # Shown values, rounded to their displayed precision (adding 0.0 turns -0.0 into 0.0)
+        signature = (
+            round(self.simulation_time, 3) + 0.0,
+            round(self.ball.x, 1) + 0.0,
+            round(self.ball.y, 1) + 0.0,
+            round(self.ball.velocity_y, 1) + 0.0,
+            round(self.ball.acceleration_y, 1) + 0.0,
+            round(total_energy) + 0.0,
+            self.is_playing,
+            self.step_by_frames,
+            history_info['frames_stored'],
+            history_info['max_frames'],
+        )
+        if signature != self._info_signature:
+            self._info_signature = signature
+            self._info_surface = self.render_info_block(signature)
+    
+    def render_info_block(self, signature):
+        """Render the physics info lines onto one transparent surface."""
+        (time, x, y, velocity, acceleration, energy,
+         is_playing, step_by_frames, frames_stored, max_frames) = signature
+        info_lines = [
+            f"Time: {time:.3f} s",
+            f"Position: ({x:.1f}, {y:.1f}) px",
+            f"Velocity: {velocity:.1f} px/s",
+            f"Acceleration: {acceleration:.1f} px/s²",
+            f"Energy: {energy:.0f} J",
+            f"Status: {'Playing' if is_playing else 'Paused'}",
+            f"Step Mode: {'Frames' if step_by_frames else 'Seconds'}",
+            f"History: {frames_stored}/{max_frames} frames"
+        ]
+        
+        texts = [_render_cached(self.font, line, (255, 255, 255)) for line in info_lines]
+        width = max(text.get_width() for text in texts)
+        height = (len(texts) - 1) * 25 + texts[-1].get_height()
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        for i, text in enumerate(texts):
+            surface.blit(text, (0, i * 25))
+        return surface
+    
+    def render_controls_block(self, step_unit):
+        """Render the controls help lines onto one transparent surface."""
         controls = [
             "Keyboard Controls:",
             "I: Toggle info",
@@ -641,12 +881,19 @@ class PhysicsSimulation:
             "• Toggle mode with Step button"
         ]
         
-        for i, line in enumerate(controls):
+        texts = []
+        for line in controls:
             color = (200, 200, 200) if line else (100, 100, 100)
             if line.startswith("•"):
                 color = (180, 180, 180)
-            text = self.small_font.render(line, True, color)
-            self.screen.blit(text, (10, self.height - 160 + i * 18))
+            texts.append(_render_cached(self.small_font, line, color))
+        
+        width = max(text.get_width() for text in texts)
+        height = (len(texts) - 1) * 18 + texts[-1].get_height()
+        surface = pygame.Surface((width, height), pygame.SRCALPHA)
+        for i, text in enumerate(texts):
+            surface.blit(text, (0, i * 18))
+        return surface
     
     def reset_ball(self):
         """Reset the ball to initial position and clear history."""
@@ -654,18 +901,26 @@ class PhysicsSimulation:
         self.ball.y = 100
         self.ball.velocity_y = 0
         self.ball.acceleration_y = 0
-        self.history.clear()  # Clear history when resetting
-        self.time_history.clear()
+        # Clear history when resetting
+        self._hist_head = 0
+        self._hist_count = 0
     
     def handle_events(self):
         """Handle pygame events."""
         for event in pygame.event.get():
-            # Check GUI elements first
+            # Every queued event can change what is shown
+            self._full_redraw = True
+            
+            # Check GUI elements first, visiting only those that respond to
+            # this event type
             event_consumed = False
-            for element in self.gui_elements:
-                if element.handle_event(event):
-                    event_consumed = True
-                    break
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                event_consumed = self.handle_click(event)
+            else:
+                for element in self._event_handlers.get(event.type, ()):
+                    if element.handle_event(event):
+                        event_consumed = True
+                        break
             
             if event_consumed:
                 continue
@@ -680,6 +935,73 @@ class PhysicsSimulation:
                     self.show_info = not self.show_info
         return True
     
+    def draw_scene(self):
+        """Draw everything: background, ball, info and GUI elements."""
+        self.screen.blit(self.background, (0, 0))
+        self.ball.draw(self.screen)
+        self.draw_ui()
+        
+        # Draw GUI elements
+        for element in self.gui_elements:
+            element.draw(self.screen)
+    
+    def redraw_area(self, rect, ball_rect):
+        """Redraw one changed area from the background up, skipping layers that miss it."""
+        self.screen.set_clip(rect)
+        self.screen.blit(self.background, rect, rect)
+        if rect.colliderect(ball_rect):
+            self.ball.draw(self.screen)
+        # The info and label blits are clipped to the area, so they cost little
+        self.draw_ui()
+        for element in self.gui_elements:
+            if rect.colliderect(element.get_draw_rect()):
+                element.draw(self.screen)
+    
+    def draw(self):
+        """Draw and present the frame, limited to the areas that changed when possible."""
+        ball_rect = self.ball.get_draw_rect()
+        if self.show_info:
+            self.refresh_info_surface()
+        
+        if self._full_redraw or self._prev_ball_rect is None:
+            self.draw_scene()
+            pygame.display.flip()
+        else:
+            dirty_rects = []
+            if ball_rect != self._prev_ball_rect:
+                dirty_rects.append(ball_rect.union(self._prev_ball_rect))
+            if self.show_info and self._info_surface is not self._prev_info_surface:
+                info_rect = self._info_surface.get_rect(topleft=(10, 10))
+                dirty_rects.append(info_rect.union(self._prev_info_surface.get_rect(topleft=(10, 10))))
+            # Focused fields blink their cursor
+            dirty_rects.extend(field.rect for field in self._input_fields if field.active)
+            
+            # Layers are redrawn in scene order inside each area, so overlaps
+            # come out exactly as in a full redraw
+            for rect in dirty_rects:
+                self.redraw_area(rect, ball_rect)
+            self.screen.set_clip(None)
+            if dirty_rects:
+                pygame.display.update(dirty_rects)
+        
+        self._prev_ball_rect = ball_rect
+        self._prev_info_surface = self._info_surface if self.show_info else None
+        self._full_redraw = False
+    
+    def handle_click(self, event):
+        """Pass a mouse press to the widget under it. Return True if one consumed it."""
+        # Every input field sees the click, so clicking anywhere else takes its focus
+        for field in self._input_fields:
+            field.handle_event(event)
+        
+        hit = pygame.Rect(event.pos, (1, 1)).collidelist(self._gui_rects)
+        if hit < 0:
+            return False
+        element = self.gui_elements[hit]
+        if isinstance(element, InputField):
+            return element.active
+        return element.handle_event(event)
+    
     def run(self):
         """Main simulation loop."""
         running = True
@@ -697,22 +1019,11 @@ class PhysicsSimulation:
             
             # Update physics only if playing
             if self.is_playing:
-                self.save_state()
-                self.ball.update(self.dt, self.ground_y)
-                self.ball.check_ground_collision(self.ground_y)
-                self.simulation_time += self.dt
+                self.advance_frame()
             
-            # Draw everything
-            self.screen.blit(self.background, (0, 0))
-            self.ball.draw(self.screen)
-            self.draw_ui()
-            
-            # Draw GUI elements
-            for element in self.gui_elements:
-                element.draw(self.screen)
-            
-            # Update display
-            pygame.display.flip()
+            # While paused with no input and no blinking cursor, the last frame is still current
+            if self._full_redraw or self.is_playing or any(field.active for field in self._input_fields):
+                self.draw()
         
         pygame.quit()
         sys.exit()
@@ -1,4 +1,6 @@
 import math
+from collections import deque
+from itertools import islice
 
 class Ball:
     """A physics-based ball object with vertical motion simulation."""
@@ -74,9 +76,9 @@ class PhysicsSimulation:
         self.dt = 1 / self.target_fps
         
         # State history
-        self.history = []
-        self.time_history = []
         self.max_history = 500
+        self.history = deque(maxlen=self.max_history)
+        self.time_history = deque(maxlen=self.max_history)
         
         # Viewport settings for dynamic scaling
         self.viewport_padding = 50  # Padding around content
@@ -118,10 +120,7 @@ class PhysicsSimulation:
     
     def save_state(self):
         """Save the current state to history."""
-        if len(self.history) >= self.max_history:
-            self.history.pop(0)
-            self.time_history.pop(0)
-            
+        # The deques drop their oldest entry once full
         self.history.append(self.ball.get_state())
         self.time_history.append(self.simulation_time)
     
@@ -206,7 +205,7 @@ class PhysicsSimulation:
             self.simulation_time = self.time_history[best_idx]
             
             # Truncate history to this point
-            self.history = self.history[:best_idx + 1]
-            self.time_history = self.time_history[:best_idx + 1]
+            self.history = deque(islice(self.history, best_idx + 1), maxlen=self.max_history)
+            self.time_history = deque(islice(self.time_history, best_idx + 1), maxlen=self.max_history)
         
         return self.get_state() 
\ No newline at end of file
@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from typing import Tuple
 
 
-@dataclass
+@dataclass(frozen=True)
 class SimulationConfig:
     """Configuration for physics simulation."""
     
@@ -29,9 +29,17 @@ class SimulationConfig:
     # Time control
     TARGET_FPS: int = 144
     MAX_HISTORY_FRAMES: int = 500
+    MAX_SUBSTEPS_PER_FRAME: int = 8  # Limits catch-up work after a slow frame
+    
+    # Rendering
+    VSYNC: bool = False  # Let the display pace frames instead of the app
+    TARGET_RENDER_FPS: int = 144  # Frame cap used when vsync is off
+    BACKGROUND_RENDER_FPS: int = 10  # Frame cap while the window is unfocused or minimized
+    IDLE_EVENT_TIMEOUT_MS: int = 100  # Longest wait for input while paused
+    EVENT_POLL_FPS: int = 60  # Input polling rate while playing
 
 
-@dataclass
+@dataclass(frozen=True)
 class UIConfig:
     """Configuration for user interface."""
     
@@ -70,7 +78,7 @@ class UIConfig:
     SHADOW_COLOR: Tuple[int, int, int] = (0, 0, 0)
 
 
-@dataclass
+@dataclass(frozen=True)
 class LoggingConfig:
     """Configuration for logging system."""
     
@@ -2,9 +2,21 @@
 Logging configuration for the physics simulation.
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
-from typing import Optional
+from typing import List, Optional
+
+from .constants import LoggingConfig
+
+# Writes queued records to the real handlers on its own thread
+_listener: Optional[logging.handlers.QueueListener] = None
+
+# Whether setup_logging() enabled DEBUG, for guarding debug calls in hot paths.
+# Read it through the module, since setup_logging() may run after import.
+DEBUG_ENABLED = False
 
 
 def setup_logging(level: str = "INFO", log_file: Optional[str] = None) -> None:
@@ -15,8 +27,11 @@ def setup_logging(level: str = "INFO", log_file: Optional[str] = None) -> None:
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Optional file path to write logs to
     """
+    global _listener, DEBUG_ENABLED
+    
     # Convert string level to logging constant
     numeric_level = getattr(logging, level.upper(), logging.INFO)
+    DEBUG_ENABLED = numeric_level <= logging.DEBUG
     
     # Create formatter
     formatter = logging.Formatter(
@@ -29,23 +44,46 @@ def setup_logging(level: str = "INFO", log_file: Optional[str] = None) -> None:
     
     # Clear existing handlers
     logger.handlers.clear()
+    stop_logging()
     
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(numeric_level)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers: List[logging.Handler] = [console_handler]
     
-    # File handler (optional)
+    # File handler (optional), rotated so the log cannot grow without bound
     if log_file:
-        file_handler = logging.FileHandler(log_file)
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_file, maxBytes=LoggingConfig.MAX_LOG_SIZE,
+            backupCount=LoggingConfig.BACKUP_COUNT
+        )
         file_handler.setLevel(numeric_level)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    # Logging calls only enqueue the record; the listener thread does the I/O
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _listener = logging.handlers.QueueListener(log_queue, *handlers,
+                                               respect_handler_level=True)
+    _listener.start()
     
-    # Suppress pygame logs unless debugging
+    # Suppress pygame and GUI widget logs unless debugging
     if numeric_level > logging.DEBUG:
         logging.getLogger('pygame').setLevel(logging.WARNING)
+        logging.getLogger('ui.gui_elements').setLevel(logging.WARNING)
+
+
+def stop_logging() -> None:
+    """Write out queued log records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(stop_logging)
 
 
 def get_logger(name: str) -> logging.Logger:
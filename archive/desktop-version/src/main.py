@@ -6,15 +6,24 @@ Physics ball simulation with modular design and clean separation of concerns.
 
 import pygame
 import sys
-from typing import List
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
 
 from ui import Button, InputField, Checkbox
-from simulation import PhysicsSimulation, Renderer
+from simulation import PhysicsSimulation, PhysicsThread, Renderer
 from config import SimulationConfig, UIConfig, setup_logging, get_logger
 
 setup_logging()
 logger = get_logger(__name__)
 
+# Event types the app reacts to; SDL drops everything else before queueing it
+HANDLED_EVENTS = [pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP,
+                  pygame.WINDOWFOCUSLOST, pygame.WINDOWFOCUSGAINED,
+                  pygame.WINDOWMINIMIZED, pygame.WINDOWRESTORED, pygame.WINDOWEXPOSED]
+
+# Size in pixels of the grid cells used to find the widgets under the mouse
+HIT_GRID_CELL_SIZE = 64
+
 
 class PhysicsSimulationApp:
     """Main application class that coordinates all components."""
@@ -26,17 +35,42 @@ class PhysicsSimulationApp:
         
         # Initialize Pygame
         pygame.init()
-        self.screen = pygame.display.set_mode((self.width, self.height))
+        self.vsync = SimulationConfig.VSYNC
+        flags = pygame.DOUBLEBUF | pygame.SCALED if self.vsync else pygame.DOUBLEBUF
+        self.screen = pygame.display.set_mode((self.width, self.height), flags,
+                                              vsync=1 if self.vsync else 0)
         pygame.display.set_caption("Vertical Ball Physics Simulation")
-        self.clock = pygame.time.Clock()
+        self.clock = pygame.time.Clock()  # Only measures frame time
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(HANDLED_EVENTS)
+        self.frame_duration = 1.0 / SimulationConfig.TARGET_RENDER_FPS
+        self.background_frame_duration = 1.0 / SimulationConfig.BACKGROUND_RENDER_FPS
+        self.event_poll_interval = 1.0 / SimulationConfig.EVENT_POLL_FPS
         
         # Create core components
         self.simulation = PhysicsSimulation(self.width, self.height, "screen")
+        self.physics = PhysicsThread(self.simulation)
         self.renderer = Renderer(self.width, self.height)
         
         # UI state
         self.show_info = True
         self.gui_elements: List = []
+        self._input_fields: List[InputField] = []  # The only widgets that animate
+        self._cell_to_widgets: Dict[Tuple[int, int, int], List] = {}
+        self._focused_widget = None  # Input field receiving key presses
+        self._pressed_widget = None  # Widget that took the last mouse press
+        
+        # Whether the paused screen needs to be redrawn
+        self._dirty = True
+        
+        # Window state; frames are slowed down in the background and not
+        # drawn at all while minimized
+        self._has_focus = True
+        self._minimized = False
+        
+        # Whether the next frame must be presented in full rather than by dirty rects
+        self._full_redraw = True
+        self._last_ball_rect: Optional[pygame.Rect] = None
         
         # Setup GUI
         self.setup_gui()
@@ -116,6 +150,22 @@ class PhysicsSimulationApp:
             False, self.on_auto_pause_toggled
         )
         self.gui_elements.append(self.auto_pause_checkbox)
+        
+        self._input_fields = [element for element in self.gui_elements
+                              if isinstance(element, InputField)]
+        
+        # Index widgets by mouse event type and the grid cells they cover, so
+        # a click only visits nearby widgets that respond to it
+        cell = HIT_GRID_CELL_SIZE
+        for element in self.gui_elements:
+            rect = element.rect
+            for event_type in element.EVENT_TYPES:
+                if event_type not in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+                    continue
+                for cell_x in range(rect.left // cell, (rect.right - 1) // cell + 1):
+                    for cell_y in range(rect.top // cell, (rect.bottom - 1) // cell + 1):
+                        key = (event_type, cell_x, cell_y)
+                        self._cell_to_widgets.setdefault(key, []).append(element)
     
     def on_play_pause_clicked(self) -> None:
         """Handle play/pause button click."""
@@ -182,72 +232,202 @@ class PhysicsSimulationApp:
         state = self.simulation.get_state()
         self.play_pause_btn.text = "Pause" if state['is_playing'] else "Play"
     
-    def handle_events(self) -> bool:
-        """Handle pygame events. Returns False if app should quit."""
-        for event in pygame.event.get():
+    def handle_events(self, waited_event: Optional[pygame.event.Event] = None) -> bool:
+        """
+        Handle pygame events. Returns False if app should quit.
+        
+        Args:
+            waited_event: Event already taken off the queue by pygame.event.wait(),
+                handled before the rest of the queue
+        """
+        # Only HANDLED_EVENTS reach the queue; a typed get() would regroup them by type
+        events = pygame.event.get()
+        if waited_event is not None:
+            events.insert(0, waited_event)
+        if not events:
+            return True
+        self._dirty = True
+        self._full_redraw = True
+        
+        # GUI callbacks change the simulation, so keep the physics thread out
+        with self.physics.lock:
+            running = self._dispatch_events(events)
+            self.physics.publish()
+        self.physics.wake()
+        return running
+    
+    def _dispatch_events(self, events: List[pygame.event.Event]) -> bool:
+        """Send events to the GUI and app shortcuts. Returns False if app should quit."""
+        for event in events:
+            # Quitting wins over everything, so stop before any GUI dispatch
+            if event.type == pygame.QUIT:
+                return False
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_ESCAPE:
+                return False
+            
+            # Window state only changes frame pacing
+            if event.type in (pygame.WINDOWFOCUSLOST, pygame.WINDOWFOCUSGAINED):
+                self._has_focus = event.type == pygame.WINDOWFOCUSGAINED
+                continue
+            if event.type in (pygame.WINDOWMINIMIZED, pygame.WINDOWRESTORED):
+                self._minimized = event.type == pygame.WINDOWMINIMIZED
+                continue
+            # An uncovered window only needs the full redraw requested above
+            if event.type == pygame.WINDOWEXPOSED:
+                continue
+            
             # Check GUI elements first
-            event_consumed = False
-            for element in self.gui_elements:
+            consumer = None
+            for element in self._event_targets(event):
                 if element.handle_event(event):
-                    event_consumed = True
+                    consumer = element
                     break
             
-            if event_consumed:
+            if event.type == pygame.MOUSEBUTTONDOWN:
+                self._pressed_widget = consumer
+                self._focused_widget = consumer if consumer is not None and consumer.active else None
+            elif event.type == pygame.MOUSEBUTTONUP:
+                self._pressed_widget = None
+            
+            if consumer is not None:
                 continue
             
             # Handle other events
-            if event.type == pygame.QUIT:
-                return False
-            elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    return False
-                elif event.key == pygame.K_i:
-                    self.show_info = not self.show_info
-                    logger.debug(f"Info display {'enabled' if self.show_info else 'disabled'}")
+            if event.type == pygame.KEYDOWN and event.key == pygame.K_i:
+                self.show_info = not self.show_info
+                self.simulation.include_energy = self.show_info
+                logger.debug(f"Info display {'enabled' if self.show_info else 'disabled'}")
         
         return True
     
+    def _event_targets(self, event: pygame.event.Event) -> Sequence:
+        """Get the widgets that may consume an event, in dispatch order."""
+        if event.type == pygame.KEYDOWN:
+            return (self._focused_widget,) if self._focused_widget is not None else ()
+        if event.type not in (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP):
+            return ()
+        
+        cell = HIT_GRID_CELL_SIZE
+        x, y = event.pos
+        targets = list(self._cell_to_widgets.get((event.type, x // cell, y // cell), ()))
+        
+        # The focused field must see clicks elsewhere to lose focus, and the
+        # pressed widget must see its release wherever it happens
+        owner = self._focused_widget if event.type == pygame.MOUSEBUTTONDOWN else self._pressed_widget
+        if owner is not None and owner not in targets:
+            targets.insert(0, owner)
+        return targets
+    
     def update(self, dt: float) -> None:
         """Update application state."""
-        # Update GUI elements
-        for element in self.gui_elements:
-            element.update(dt)
-        
-        # Update simulation
-        self.simulation.update()
+        # Only input fields change on their own (cursor blink); buttons and
+        # checkboxes have nothing to update each frame
+        for field in self._input_fields:
+            field.update(dt)
+            if field.dirty:
+                field.dirty = False
+                self._dirty = True
     
     def draw(self) -> None:
         """Draw the complete application."""
-        # Get current simulation state
-        state = self.simulation.get_state()
+        # Get the latest published state, interpolated between physics steps
+        state = self.physics.render_state()
         
-        # Draw simulation
-        self.renderer.draw_simulation(self.screen, state, self.show_info)
+        # Collect widgets that changed since the last frame
+        changed_rects = []
+        for element in self.gui_elements:
+            rect = element.get_dirty_rect()
+            if rect:
+                changed_rects.append(rect)
+        
+        ball_rect = self.renderer.get_ball_rect(state)
+        if self._full_redraw or self._last_ball_rect is None:
+            # Input can change anything, so redraw and present the whole window
+            self.renderer.draw_simulation(self.screen, state, self.show_info)
+            self.renderer.draw_gui_elements(self.screen, self.gui_elements)
+            pygame.display.flip()
+        else:
+            # Everything else keeps its pixels; only the ball's old and new
+            # area, the info text (while playing) and changed widgets are
+            # redrawn and presented
+            dirty_rects = list(changed_rects)
+            if self.simulation.is_playing:
+                dirty_rects.append(ball_rect.union(self._last_ball_rect))
+                if self.show_info:
+                    dirty_rects.append(self.renderer.get_info_rect())
+                # The help text is redrawn too, so its area must be cleared first
+                areas = dirty_rects[len(changed_rects):]
+                areas.append(self.renderer.get_controls_info_rect(state))
+                self.renderer.draw_simulation(self.screen, state, self.show_info, areas)
+            if changed_rects:
+                self.renderer.draw_gui_elements(self.screen, self.gui_elements, changed_rects)
+            if dirty_rects:
+                pygame.display.update(dirty_rects)
+        
+        self._last_ball_rect = ball_rect
+        self._full_redraw = False
+        self._dirty = False
+    
+    def wait_for_next_frame(self, frame_start: float, frame_duration: Optional[float] = None) -> None:
+        """
+        Sleep until the next frame is due when vsync is not pacing the loop.
         
-        # Draw GUI elements
-        self.renderer.draw_gui_elements(self.screen, self.gui_elements)
+        Sleeps most of the remaining time, then yields in a short spin for
+        sub-millisecond accuracy.
         
-        # Update display
-        pygame.display.flip()
+        Args:
+            frame_start: perf_counter() value when the current frame began
+            frame_duration: Seconds per frame, defaults to the target render rate
+        """
+        frame_end = frame_start + (frame_duration or self.frame_duration)
+        remaining = frame_end - time.perf_counter()
+        if remaining > 0.001:
+            time.sleep(remaining - 0.0005)
+        while time.perf_counter() < frame_end:
+            time.sleep(0)
     
     def run(self) -> None:
         """Main application loop."""
         logger.info("Starting physics simulation...")
+        self.physics.start()
         
         running = True
+        next_event_poll = 0.0
         while running:
+            if not self.simulation.is_playing:
+                # Nothing moves while paused, so sleep until input arrives
+                event = pygame.event.wait(SimulationConfig.IDLE_EVENT_TIMEOUT_MS)
+                dt_real = self.clock.tick() / 1000.0
+                running = self.handle_events(event if event.type != pygame.NOEVENT else None)
+                self.update(dt_real)
+                if self._dirty:
+                    self.draw()
+                continue
+            
+            frame_start = time.perf_counter()
+            
             # Calculate delta time
-            dt_real = self.clock.tick(self.simulation.target_fps) / 1000.0
+            dt_real = self.clock.tick() / 1000.0
             
-            # Handle events
-            running = self.handle_events()
+            # Handle events, polling the queue no faster than EVENT_POLL_FPS
+            if frame_start >= next_event_poll:
+                running = self.handle_events()
+                next_event_poll = frame_start + self.event_poll_interval
             
             # Update
             self.update(dt_real)
             
-            # Draw
-            self.draw()
+            # Draw, unless nothing can be seen
+            if not self._minimized:
+                self.draw()
+            
+            if self._minimized or not self._has_focus:
+                # Physics keeps running on its thread; only rendering slows down
+                self.wait_for_next_frame(frame_start, self.background_frame_duration)
+            elif not self.vsync:
+                self.wait_for_next_frame(frame_start)
         
+        self.physics.stop()
         logger.info("Physics simulation ended")
         pygame.quit()
         sys.exit()
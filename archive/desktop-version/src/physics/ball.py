@@ -4,6 +4,7 @@ Unified Ball Physics Class
 A ball object with vertical motion simulation that can work with different coordinate systems.
 """
 
+from functools import lru_cache
 from typing import Dict, Any, Optional, Tuple
 import os
 
@@ -20,6 +21,17 @@ except ImportError:
 logger = get_logger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _scaled_texture(path: str, size: Tuple[int, int]):
+    """Load an image and scale it, once per path and size; every ball shares the result."""
+    import pygame
+    texture = pygame.transform.scale(pygame.image.load(path), size)
+    # Match the display's pixel format once so blits need no conversion
+    if pygame.display.get_surface() is not None:
+        texture = texture.convert_alpha()
+    return texture
+
+
 class Ball:
     """A physics-based ball object with vertical motion simulation."""
     
@@ -72,9 +84,8 @@ class Ball:
             import pygame
             
             if os.path.exists(PhysicsConstants.BALL_TEXTURE_PATH):
-                self.texture = pygame.image.load(PhysicsConstants.BALL_TEXTURE_PATH)
                 scaled_size = (int(self.radius * 2), int(self.radius * 2))
-                self.texture = pygame.transform.scale(self.texture, scaled_size)
+                self.texture = _scaled_texture(PhysicsConstants.BALL_TEXTURE_PATH, scaled_size)
                 logger.debug("Ball texture loaded successfully")
             else:
                 logger.warning(f"Texture file not found: {PhysicsConstants.BALL_TEXTURE_PATH}")
@@ -100,11 +111,11 @@ class Ball:
                 raise ValueError("ground_y is required for screen coordinate system")
             is_at_rest = self.velocity_y == 0 and self.y + self.radius >= ground_y
         
-        # Apply gravity if not at rest
-        if not is_at_rest:
-            self.acceleration_y = self.gravity
-        else:
+        # A resting ball stays put; the kinematic update would only add zeros
+        if is_at_rest:
             self.acceleration_y = 0
+            return
+        self.acceleration_y = self.gravity
         
         # Update velocity and position using kinematic equations
         self.velocity_y += self.acceleration_y * dt
@@ -5,6 +5,7 @@ Contains simulation logic and state management.
 """
 
 from .physics_simulation import PhysicsSimulation
+from .physics_thread import PhysicsThread
 from .renderer import SimulationRenderer as Renderer
 
-__all__ = ['PhysicsSimulation', 'Renderer']
\ No newline at end of file
+__all__ = ['PhysicsSimulation', 'PhysicsThread', 'Renderer']
\ No newline at end of file
@@ -5,17 +5,12 @@ Core simulation logic separated from rendering and UI concerns.
 """
 
 from typing import Dict, Any, List, Tuple, Optional
-from collections import deque
+from array import array
+from bisect import bisect_left
 
-try:
-    from ..physics import Ball
-    from ..config.constants import SimulationConfig
-    from ..config.logging_config import get_logger
-except ImportError:
-    # Fallback for direct execution
-    from physics import Ball
-    from config.constants import SimulationConfig
-    from config.logging_config import get_logger
+from physics import Ball
+from config.constants import SimulationConfig
+from config.logging_config import get_logger
 
 logger = get_logger(__name__)
 
@@ -54,13 +49,22 @@ class PhysicsSimulation:
         self.dt = 1 / self.target_fps
         self.auto_pause_after_step = False
         
-        # State management
-        self.history = deque(maxlen=SimulationConfig.MAX_HISTORY_FRAMES)
-        self.time_history = deque(maxlen=SimulationConfig.MAX_HISTORY_FRAMES)
+        # State management: a fixed-size ring of saved frames, one array per field
+        self.max_history_frames = SimulationConfig.MAX_HISTORY_FRAMES
+        self._hist_time = array('d', [0.0]) * self.max_history_frames
+        self._hist_x = array('d', [0.0]) * self.max_history_frames
+        self._hist_y = array('d', [0.0]) * self.max_history_frames
+        self._hist_vy = array('d', [0.0]) * self.max_history_frames
+        self._hist_ay = array('d', [0.0]) * self.max_history_frames
+        self._hist_head = 0  # Slot the next frame is written to
+        self._hist_count = 0
         
         # Step control
         self.step_by_frames = False
         
+        # Energy is only shown with the info display; skip it when nobody reads it
+        self.include_energy = True
+        
         logger.info(f"Created PhysicsSimulation: {self.width}x{self.height}, {coordinate_system} coordinates")
     
     def update(self) -> Dict[str, Any]:
@@ -81,8 +85,68 @@ class PhysicsSimulation:
     
     def save_state(self) -> None:
         """Save the current state to history."""
-        self.history.append(self.ball.get_state())
-        self.time_history.append(self.simulation_time)
+        head = self._hist_head
+        ball = self.ball
+        self._hist_time[head] = self.simulation_time
+        self._hist_x[head] = ball.x
+        self._hist_y[head] = ball.y
+        self._hist_vy[head] = ball.velocity_y
+        self._hist_ay[head] = ball.acceleration_y
+        self._hist_head = (head + 1) % self.max_history_frames
+        if self._hist_count < self.max_history_frames:
+            self._hist_count += 1
+    
+    def _history_slot(self, index: int) -> int:
+        """Map a history index (0 is oldest, -1 is newest) to its ring slot."""
+        if index < 0:
+            index += self._hist_count
+        return (self._hist_head - self._hist_count + index) % self.max_history_frames
+    
+    def _time_at(self, index: int) -> float:
+        """Get the simulation time of a saved frame."""
+        return self._hist_time[self._history_slot(index)]
+    
+    def _restore_newest(self) -> None:
+        """Put the ball and clock back to the newest saved frame."""
+        slot = self._history_slot(-1)
+        self.simulation_time = self._hist_time[slot]
+        self.ball.set_state({
+            'x': self._hist_x[slot],
+            'y': self._hist_y[slot],
+            'velocity_y': self._hist_vy[slot],
+            'acceleration_y': self._hist_ay[slot],
+        })
+    
+    def _truncate_history(self, count: int) -> None:
+        """Keep only the oldest `count` saved frames."""
+        self._hist_head = (self._hist_head - self._hist_count + count) % self.max_history_frames
+        self._hist_count = count
+    
+    def _search_time(self, target_time: float) -> int:
+        """
+        Find the first saved frame at or after a time.
+        
+        Saved times increase from oldest to newest, so the ring is searched as
+        two sorted runs: from the oldest slot to the end of the buffer, then
+        from the start of the buffer.
+        
+        Returns:
+            History index of that frame, or the frame count if every saved
+            frame is earlier
+        """
+        times = self._hist_time
+        start = self._history_slot(0)
+        first_run = min(self._hist_count, self.max_history_frames - start)
+        
+        index = bisect_left(times, target_time, start, start + first_run) - start
+        if index < first_run:
+            return index
+        return first_run + bisect_left(times, target_time, 0, self._hist_count - first_run)
+    
+    def _clear_history(self) -> None:
+        """Drop all saved frames."""
+        self._hist_head = 0
+        self._hist_count = 0
     
     def get_state(self) -> Dict[str, Any]:
         """Get current simulation state."""
@@ -98,6 +162,9 @@ class PhysicsSimulation:
             'auto_pause_after_step': self.auto_pause_after_step
         }
         
+        if not self.include_energy:
+            return state
+        
         # Add energy information
         if self.coordinate_system == "screen":
             kinetic, potential, total = self.ball.get_energy(self.ground_y)
@@ -129,8 +196,7 @@ class PhysicsSimulation:
             initial_y = SimulationConfig.DEFAULT_PHYSICS_START_Y
         
         self.ball.reset_to_position(self.width // 2, initial_y)
-        self.history.clear()
-        self.time_history.clear()
+        self._clear_history()
         
         logger.info("Simulation reset")
         return self.get_state()
@@ -182,16 +248,12 @@ class PhysicsSimulation:
                 self.simulation_time += self.dt
         elif frame_count < 0:
             # Step backward (rewind)
-            frames_to_rewind = min(abs(frame_count), len(self.history))
-            for _ in range(frames_to_rewind):
-                if self.history and self.time_history:
-                    self.history.pop()
-                    self.time_history.pop()
+            frames_to_rewind = min(abs(frame_count), self._hist_count)
+            self._truncate_history(self._hist_count - frames_to_rewind)
             
             # Apply the rewound state
-            if self.history and self.time_history:
-                self.ball.set_state(self.history[-1])
-                self.simulation_time = self.time_history[-1]
+            if self._hist_count:
+                self._restore_newest()
             else:
                 self.reset()
         
@@ -225,53 +287,44 @@ class PhysicsSimulation:
     
     def rewind_to_time(self, target_time: float) -> None:
         """Rewind to the closest available time in history."""
-        if not self.time_history:
+        if not self._hist_count:
             self.reset()
             return
         
-        # Find the closest time in history
-        best_idx = 0
-        best_diff = abs(self.time_history[0] - target_time)
-        
-        for i, t in enumerate(self.time_history):
-            diff = abs(t - target_time)
-            if diff < best_diff:
-                best_diff = diff
-                best_idx = i
+        # Saved times never decrease, so bisect for the closest one; on a tie
+        # the earliest frame wins
+        best_idx = self._search_time(target_time)
+        if best_idx == self._hist_count or (
+                best_idx > 0 and
+                target_time - self._time_at(best_idx - 1) <= self._time_at(best_idx) - target_time):
+            # A rewound frame is saved again when stepping resumes, so times
+            # can repeat; go back to the first frame with this time
+            best_idx = self._search_time(self._time_at(best_idx - 1))
         
         # Rewind to that state
-        frames_to_rewind = len(self.history) - best_idx - 1
-        if frames_to_rewind > 0:
-            for _ in range(frames_to_rewind):
-                if self.history and self.time_history:
-                    self.history.pop()
-                    self.time_history.pop()
-        
-        if self.history and self.time_history:
-            self.ball.set_state(self.history[-1])
-            self.simulation_time = self.time_history[-1]
+        self._truncate_history(best_idx + 1)
+        self._restore_newest()
     
     def set_ball_start_position(self, x: float, y: float) -> Dict[str, Any]:
         """Set the ball's starting position and reset."""
         self.simulation_time = 0.0
         self.is_playing = False
         self.ball.reset_to_position(x, y)
-        self.history.clear()
-        self.time_history.clear()
+        self._clear_history()
         
         logger.debug(f"Set ball start position to ({x}, {y})")
         return self.get_state()
     
     def can_rewind(self) -> bool:
         """Check if there are states available for rewinding."""
-        return len(self.history) > 1
+        return self._hist_count > 1
     
     def get_history_info(self) -> Dict[str, Any]:
         """Get information about the current history state."""
         return {
-            'frames_stored': len(self.history),
-            'max_frames': self.history.maxlen,
-            'time_stored_seconds': len(self.history) / self.target_fps,
+            'frames_stored': self._hist_count,
+            'max_frames': self.max_history_frames,
+            'time_stored_seconds': self._hist_count / self.target_fps,
             'can_rewind': self.can_rewind()
         }
     
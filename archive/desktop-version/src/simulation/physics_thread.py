@@ -0,0 +1,105 @@
+"""
+Physics Thread Module
+
+Runs the simulation at a fixed rate on its own thread, so rendering stalls do
+not disturb the physics cadence.
+"""
+
+import threading
+import time
+from typing import Dict, Any, Tuple
+
+from config.constants import SimulationConfig
+from config.logging_config import get_logger
+
+from .physics_simulation import PhysicsSimulation
+
+logger = get_logger(__name__)
+
+
+class PhysicsThread(threading.Thread):
+    """Steps a PhysicsSimulation on a wall-clock timer and publishes snapshots."""
+    
+    def __init__(self, simulation: PhysicsSimulation):
+        """
+        Initialize the physics thread.
+        
+        Args:
+            simulation: Simulation to step; other threads must hold `lock`
+                while they change it
+        """
+        super().__init__(name="physics", daemon=True)
+        self.simulation = simulation
+        self.lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._wake_event = threading.Event()
+        
+        # Latest published (previous ball y, current state, publish time). A new
+        # tuple is swapped in with one assignment, so readers never need the
+        # lock and never see a half-written snapshot.
+        self._snapshot: Tuple[float, Dict[str, Any], float] = (0.0, {}, 0.0)
+        self.publish()
+    
+    def publish(self) -> None:
+        """Publish the simulation state for the render thread. Call with `lock` held."""
+        simulation = self.simulation
+        current = simulation.get_state()
+        # While playing, the newest saved frame is the step before this one
+        if simulation.is_playing and simulation._hist_count:
+            previous_y = simulation._hist_y[simulation._history_slot(-1)]
+        else:
+            previous_y = current['ball']['y']
+        self._snapshot = (previous_y, current, time.perf_counter())
+    
+    def render_state(self) -> Dict[str, Any]:
+        """
+        Get the latest state with the ball blended toward the next physics step.
+        
+        Returns:
+            State dictionary safe to use without holding `lock`
+        """
+        previous_y, current, published_at = self._snapshot
+        if not current['is_playing']:
+            return current
+        
+        alpha = min(1.0, (time.perf_counter() - published_at) / self.simulation.dt)
+        ball = dict(current['ball'], y=previous_y + (current['ball']['y'] - previous_y) * alpha)
+        return dict(current, ball=ball)
+    
+    def wake(self) -> None:
+        """Resume stepping after the simulation was started while idle."""
+        self._wake_event.set()
+    
+    def stop(self) -> None:
+        """Ask the thread to finish and wait for it."""
+        self._stop_event.set()
+        self._wake_event.set()
+        if self.is_alive():
+            self.join()
+    
+    def run(self) -> None:
+        """Step the simulation every dt until stopped."""
+        step = self.simulation.dt
+        max_lag = step * SimulationConfig.MAX_SUBSTEPS_PER_FRAME
+        next_tick = time.perf_counter()
+        
+        while not self._stop_event.is_set():
+            if not self.simulation.is_playing:
+                # Nothing to step; sleep until the app starts playback
+                self._wake_event.wait()
+                self._wake_event.clear()
+                next_tick = time.perf_counter()
+                continue
+            
+            with self.lock:
+                self.simulation.update()
+                self.publish()
+            
+            next_tick += step
+            delay = next_tick - time.perf_counter()
+            if delay > 0:
+                self._stop_event.wait(delay)
+            elif -delay > max_lag:
+                # Fell too far behind; drop the backlog instead of spiralling
+                logger.debug(f"Physics thread dropped {-delay:.3f}s of backlog")
+                next_tick = time.perf_counter()
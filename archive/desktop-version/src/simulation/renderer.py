@@ -5,18 +5,31 @@ Handles all rendering operations for the physics simulation.
 """
 
 import pygame
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 try:
     from ..config.constants import UIConfig, SimulationConfig
     from ..config.logging_config import get_logger
+    from ..ui import draw_elements, get_font
 except ImportError:
     # Fallback for direct execution
     from config.constants import UIConfig, SimulationConfig
     from config.logging_config import get_logger
+    from ui import draw_elements, get_font
 
 logger = get_logger(__name__)
 
+# Info panel line templates, filled from the values built in draw_simulation_info()
+_INFO_TEMPLATES = (
+    "Time: {:.3f} s",
+    "Position: ({:.1f}, {:.1f}) px",
+    "Velocity: {:.1f} px/s",
+    "Acceleration: {:.1f} px/s²",
+    "Energy: {:.0f} J",
+    "Status: {}",
+    "Step Mode: {}",
+)
+
 
 class SimulationRenderer:
     """Handles rendering of the physics simulation."""
@@ -33,8 +46,17 @@ class SimulationRenderer:
         self.height = height
         
         # Fonts
-        self.font = pygame.font.Font(None, UIConfig.DEFAULT_FONT_SIZE)
-        self.small_font = pygame.font.Font(None, UIConfig.SMALL_FONT_SIZE)
+        self.font = get_font(UIConfig.DEFAULT_FONT_SIZE)
+        self.small_font = get_font(UIConfig.SMALL_FONT_SIZE)
+        
+        # Controls help block, rendered once per step unit
+        self._controls_info_cache: Dict[str, pygame.Surface] = {}
+        
+        # Last rendered (values, surface) of each info line
+        self._info_line_cache: List[Tuple[Tuple[Any, ...], pygame.Surface]] = []
+        
+        # Opaque shadow ellipse per ball radius; its alpha is set per frame
+        self._shadow_cache: Dict[int, pygame.Surface] = {}
         
         # Pre-render static background for performance
         self.background = None
@@ -71,6 +93,9 @@ class SimulationRenderer:
         pygame.draw.line(self.background, UIConfig.BORDER_COLOR, 
                         (sim_width, 0), (sim_width, self.height), 2)
         
+        # Static panel labels never change, so bake them in too
+        self.draw_control_labels(self.background)
+        
         logger.debug("Background pre-rendered")
     
     def draw_simulation_info(self, screen: pygame.Surface, state: Dict[str, Any], 
@@ -95,20 +120,31 @@ class SimulationRenderer:
         else:
             height_above_ground = max(0, ball['y'] - ball['radius'])
         
-        # Main info lines
-        info_lines = [
-            f"Time: {state['time']:.3f} s",
-            f"Position: ({ball['x']:.1f}, {ball['y']:.1f}) px",
-            f"Velocity: {ball['velocity_y']:.1f} px/s",
-            f"Acceleration: {ball['acceleration_y']:.1f} px/s²",
-            f"Energy: {energy['total']:.0f} J",
-            f"Status: {'Playing' if state['is_playing'] else 'Paused'}",
-            f"Step Mode: {'Frames' if state.get('step_by_frames', False) else 'Seconds'}"
-        ]
-        
-        # Draw info lines
-        for i, line in enumerate(info_lines):
-            text = self.font.render(line, True, UIConfig.TEXT_COLOR)
+        # Values shown on each line, rounded to the displayed precision so
+        # float jitter below it does not count as a change (adding 0.0 folds
+        # -0.0 into 0.0)
+        line_values = (
+            (round(state['time'], 3) + 0.0,),
+            (round(ball['x'], 1) + 0.0, round(ball['y'], 1) + 0.0),
+            (round(ball['velocity_y'], 1) + 0.0,),
+            (round(ball['acceleration_y'], 1) + 0.0,),
+            (round(energy['total']) + 0.0,),
+            ('Playing' if state['is_playing'] else 'Paused',),
+            ('Frames' if state.get('step_by_frames', False) else 'Seconds',),
+        )
+        
+        # Draw info lines, formatting and rendering only the ones whose values changed
+        cache = self._info_line_cache
+        for i, values in enumerate(line_values):
+            if i < len(cache) and cache[i][0] == values:
+                text = cache[i][1]
+            else:
+                line = _INFO_TEMPLATES[i].format(*values)
+                text = self.font.render(line, True, UIConfig.TEXT_COLOR)
+                if i < len(cache):
+                    cache[i] = (values, text)
+                else:
+                    cache.append((values, text))
             screen.blit(text, (10, 10 + i * 25))
     
     def draw_control_labels(self, screen: pygame.Surface) -> None:
@@ -122,7 +158,7 @@ class SimulationRenderer:
         # Helper text
         helper_text = "(+/- values allowed)"
         helper_label = self.small_font.render(helper_text, True, UIConfig.HELPER_TEXT_COLOR)
-        screen.blit(label, (panel_x, 165))
+        screen.blit(helper_label, (panel_x, 165))
         
         # Set time label
         label = self.small_font.render("Set Time (s):", True, UIConfig.LABEL_COLOR)
@@ -130,8 +166,20 @@ class SimulationRenderer:
     
     def draw_controls_info(self, screen: pygame.Surface, state: Dict[str, Any]) -> None:
         """Draw controls information at bottom of screen."""
+        screen.blit(self._get_controls_info(state), (10, self.height - 160))
+    
+    def _get_controls_info(self, state: Dict[str, Any]) -> pygame.Surface:
+        """Get the controls help block for the state's step unit."""
         step_unit = "frames" if state.get('step_by_frames', False) else "seconds"
         
+        block = self._controls_info_cache.get(step_unit)
+        if block is None:
+            block = self._render_controls_info(step_unit)
+            self._controls_info_cache[step_unit] = block
+        return block
+    
+    def _render_controls_info(self, step_unit: str) -> pygame.Surface:
+        """Render the controls help block for one step unit."""
         controls = [
             "Keyboard Controls:",
             "I: Toggle info",
@@ -143,6 +191,7 @@ class SimulationRenderer:
             "• Toggle mode with Step button"
         ]
         
+        block = pygame.Surface((self.width, len(controls) * 18), pygame.SRCALPHA)
         for i, line in enumerate(controls):
             if not line:
                 continue
@@ -150,7 +199,8 @@ class SimulationRenderer:
             if line.endswith(":"):
                 color = UIConfig.TEXT_COLOR
             text = self.small_font.render(line, True, color)
-            screen.blit(text, (10, self.height - 160 + i * 18))
+            block.blit(text, (0, i * 18))
+        return block
     
     def draw_ball_with_shadow(self, screen: pygame.Surface, ball_data: Dict[str, Any], 
                             ground_y: float) -> None:
@@ -168,14 +218,12 @@ class SimulationRenderer:
         # Draw shadow
         shadow_alpha = max(0, 100 - int(abs(y - ground_y) / 2))
         if shadow_alpha > 0:
-            shadow_color = (*UIConfig.SHADOW_COLOR, shadow_alpha)
-            try:
-                import pygame.gfxdraw
-                pygame.gfxdraw.filled_ellipse(screen, x, int(ground_y), radius, 5, shadow_color)
-            except ImportError:
-                # Fallback without alpha
-                pygame.draw.ellipse(screen, UIConfig.SHADOW_COLOR[:3], 
-                                  (x - radius, int(ground_y) - 5, radius * 2, 10))
+            shadow = self._shadow_cache.get(radius)
+            if shadow is None:
+                shadow = self._render_shadow(radius)
+                self._shadow_cache[radius] = shadow
+            shadow.set_alpha(shadow_alpha)
+            screen.blit(shadow, (x - radius, int(ground_y) - 5))
         
         # Draw ball
         import pygame as pg
@@ -187,8 +235,48 @@ class SimulationRenderer:
         highlight_radius = radius // 2
         pg.draw.circle(screen, UIConfig.BALL_HIGHLIGHT_COLOR, highlight_pos, highlight_radius)
     
+    def _render_shadow(self, radius: int) -> pygame.Surface:
+        """Render the shadow ellipse for a ball radius at full opacity."""
+        shadow = pygame.Surface((radius * 2 + 1, 11), pygame.SRCALPHA)
+        try:
+            from pygame import gfxdraw
+            gfxdraw.filled_ellipse(shadow, radius, 5, radius, 5, UIConfig.SHADOW_COLOR)
+        except ImportError:
+            pygame.draw.ellipse(shadow, UIConfig.SHADOW_COLOR, (0, 0, radius * 2, 10))
+        
+        # Match the display's pixel format so the per-frame blit needs no conversion
+        if pygame.display.get_surface() is not None:
+            shadow = shadow.convert_alpha()
+        return shadow
+    
+    def get_ball_rect(self, state: Dict[str, Any]) -> pygame.Rect:
+        """
+        Get the screen area covered by the ball and its shadow.
+        
+        Args:
+            state: Current simulation state
+            
+        Returns:
+            Rectangle enclosing everything draw_ball_with_shadow() draws
+        """
+        ball = state['ball']
+        x, y = int(ball['x']), int(ball['y'])
+        radius = int(ball['radius'])
+        ball_rect = pygame.Rect(x - radius, y - radius, radius * 2 + 1, radius * 2 + 1)
+        shadow_rect = pygame.Rect(x - radius, int(state['ground_y']) - 5, radius * 2 + 1, 11)
+        return ball_rect.union(shadow_rect)
+    
+    def get_info_rect(self) -> pygame.Rect:
+        """Get the screen area used by the simulation info lines."""
+        return pygame.Rect(0, 0, self.width - UIConfig.CONTROL_PANEL_WIDTH, 10 + 7 * 25)
+    
+    def get_controls_info_rect(self, state: Dict[str, Any]) -> pygame.Rect:
+        """Get the screen area covered by the controls help text."""
+        return self._get_controls_info(state).get_bounding_rect().move(10, self.height - 160)
+    
     def render_frame(self, screen: pygame.Surface, state: Dict[str, Any], 
-                    gui_elements: List = None, show_info: bool = True) -> None:
+                    gui_elements: List = None, show_info: bool = True,
+                    areas: Optional[List[pygame.Rect]] = None) -> None:
         """
         Render a complete frame of the simulation.
         
@@ -197,9 +285,16 @@ class SimulationRenderer:
             state: Current simulation state
             gui_elements: List of GUI elements to draw
             show_info: Whether to show simulation info
+            areas: Only restore the background in these rects, leaving the rest
+                of the screen as it was; None redraws the whole background.
+                They must cover everything that is drawn.
         """
         # Draw background
-        screen.blit(self.background, (0, 0))
+        if areas is None:
+            screen.blit(self.background, (0, 0))
+        else:
+            for area in areas:
+                screen.blit(self.background, area.topleft, area)
         
         # Draw ball
         self.draw_ball_with_shadow(screen, state['ball'], state['ground_y'])
@@ -207,23 +302,19 @@ class SimulationRenderer:
         # Draw simulation info
         self.draw_simulation_info(screen, state, show_info)
         
-        # Draw control labels
-        self.draw_control_labels(screen)
-        
         # Draw controls info
         self.draw_controls_info(screen, state)
         
         # Draw GUI elements
         if gui_elements:
-            for element in gui_elements:
-                element.draw(screen)
+            draw_elements(screen, gui_elements)
     
     def get_background(self) -> pygame.Surface:
         """Get the pre-rendered background surface."""
         return self.background.copy()
     
     def draw_simulation(self, screen: pygame.Surface, state: Dict[str, Any], 
-                       show_info: bool = True) -> None:
+                       show_info: bool = True, areas: Optional[List[pygame.Rect]] = None) -> None:
         """
         Draw the complete simulation (compatibility method).
         
@@ -231,20 +322,29 @@ class SimulationRenderer:
             screen: Pygame surface to draw on
             state: Current simulation state
             show_info: Whether to show simulation info
+            areas: Background areas to restore, see render_frame()
         """
         # This is a wrapper around render_frame for backward compatibility
-        self.render_frame(screen, state, None, show_info)
+        self.render_frame(screen, state, None, show_info, areas)
     
-    def draw_gui_elements(self, screen: pygame.Surface, gui_elements: List) -> None:
+    def draw_gui_elements(self, screen: pygame.Surface, gui_elements: List,
+                          damaged: Optional[List[pygame.Rect]] = None) -> None:
         """
         Draw GUI elements on the screen.
         
         Args:
             screen: Pygame surface to draw on
             gui_elements: List of GUI elements to draw
+            damaged: Areas to repaint; the background is restored there and
+                only elements overlapping them are drawn. None draws every element.
         """
-        for element in gui_elements:
-            element.draw(screen)
+        if damaged is None:
+            draw_elements(screen, gui_elements)
+            return
+        
+        screen.blits([(self.background, rect, rect) for rect in damaged], doreturn=False)
+        draw_elements(screen, [element for element in gui_elements
+                               if element.bounds().collidelist(damaged) != -1])
 
 
 class WebSimulationRenderer:
@@ -4,6 +4,6 @@ UI Components Module
 Contains all user interface components for the physics simulation.
 """
 
-from .gui_elements import GUIElement, Button, InputField, Checkbox
+from .gui_elements import GUIElement, Button, InputField, Checkbox, draw_elements, get_font
 
-__all__ = ['GUIElement', 'Button', 'InputField', 'Checkbox']
\ No newline at end of file
+__all__ = ['GUIElement', 'Button', 'InputField', 'Checkbox', 'draw_elements', 'get_font']
\ No newline at end of file
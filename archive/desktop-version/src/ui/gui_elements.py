@@ -6,27 +6,104 @@ Contains all GUI element classes for the physics simulation.
 
 import pygame
 from abc import ABC, abstractmethod
-from typing import Optional, Callable
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Callable, Sequence, Tuple
 
 try:
     from ..config.constants import UIConfig
+    from ..config import logging_config
     from ..config.logging_config import get_logger
 except ImportError:
     # Fallback for direct execution
     from config.constants import UIConfig
+    from config import logging_config
     from config.logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# A Surface.blits() item: (source, dest) or (source, dest, source area)
+BlitItem = Tuple[Any, ...]
+
+# Colors read on every draw, bound once at import
+_BUTTON_COLOR = UIConfig.BUTTON_COLOR
+_BUTTON_PRESSED_COLOR = UIConfig.BUTTON_PRESSED_COLOR
+_BORDER_COLOR = UIConfig.BORDER_COLOR
+
+
+@lru_cache(maxsize=None)
+def get_font(size: int) -> pygame.font.Font:
+    """Get the default font at a size, shared by everything that draws text with it."""
+    return pygame.font.Font(None, size)
+
+
+@lru_cache(maxsize=128)
+def _render_text(font: pygame.font.Font, text: str,
+                 color: Tuple[int, int, int]) -> pygame.Surface:
+    """
+    Render antialiased text, reusing the surface when the same text comes back.
+    
+    The surfaces are shared between elements, so they must only be blitted.
+    """
+    return font.render(text, True, color)
+
+
+@lru_cache(maxsize=None)
+def _frame_surface(size: Tuple[int, int], fill_color: Tuple[int, int, int],
+                   border_color: Tuple[int, int, int]) -> pygame.Surface:
+    """Pre-render a filled box with a 2px border, shared by same-sized elements."""
+    surface = pygame.Surface(size)
+    rect = surface.get_rect()
+    pygame.draw.rect(surface, fill_color, rect)
+    pygame.draw.rect(surface, border_color, rect, 2)
+    return surface
+
+
+@lru_cache(maxsize=None)
+def _checkbox_surface(size: Tuple[int, int], checked: bool) -> pygame.Surface:
+    """Pre-render a checkbox box, with its checkmark when checked."""
+    surface = _frame_surface(size, (255, 255, 255), (150, 150, 150))
+    if not checked:
+        return surface
+    
+    surface = surface.copy()
+    width, height = size
+    points = [(3, height // 2), (width // 2, height - 4), (width - 3, 3)]
+    pygame.draw.lines(surface, (0, 150, 0), False, points, 3)
+    return surface
+
+
+@lru_cache(maxsize=None)
+def _cursor_surface(height: int) -> pygame.Surface:
+    """Pre-render a 1px wide black text cursor."""
+    surface = pygame.Surface((1, height))
+    surface.fill((0, 0, 0))
+    return surface
+
+
+def draw_elements(screen: pygame.Surface, elements: Sequence['GUIElement']) -> None:
+    """Draw several elements in order with a single Surface.blits() call."""
+    items: List[BlitItem] = []
+    for element in elements:
+        items.extend(element.get_blits())
+    screen.blits(items, doreturn=False)
+
 
 class GUIElement(ABC):
     """Base class for GUI elements."""
     
+    __slots__ = ('rect', 'active', 'visible', 'dirty', '_presented_appearance')
+    
+    # Event types handle_event() responds to
+    EVENT_TYPES: Tuple[int, ...] = ()
+    
     def __init__(self, x: int, y: int, width: int, height: int):
         self.rect = pygame.Rect(x, y, width, height)
         self.active = False
         self.visible = True
-        logger.debug(f"Created {self.__class__.__name__} at ({x}, {y})")
+        self.dirty = False  # Set when the element's appearance changes on its own
+        self._presented_appearance: Optional[Tuple[Any, ...]] = None
+        if logging_config.DEBUG_ENABLED:
+            logger.debug("Created %s at (%d, %d)", self.__class__.__name__, x, y)
     
     @abstractmethod
     def handle_event(self, event: pygame.event.Event) -> bool:
@@ -37,22 +114,66 @@ class GUIElement(ABC):
         """Update the element."""
         pass
     
+    def appearance(self) -> Tuple[Any, ...]:
+        """Values that decide how the element looks."""
+        return (self.visible,)
+    
+    def bounds(self) -> pygame.Rect:
+        """Screen area the element draws into."""
+        return self.rect
+    
+    def get_dirty_rect(self) -> Optional[pygame.Rect]:
+        """
+        Get the area to present if the element changed since the last call.
+        
+        Returns:
+            The element's bounds, or None if it looks the same as last time
+        """
+        appearance = self.appearance()
+        if appearance == self._presented_appearance:
+            return None
+        self._presented_appearance = appearance
+        return self.bounds()
+    
     @abstractmethod
+    def get_blits(self) -> List[BlitItem]:
+        """Get the blits that draw the element, in order."""
+        pass
+    
     def draw(self, screen: pygame.Surface) -> None:
         """Draw the element."""
-        pass
+        screen.blits(self.get_blits(), doreturn=False)
 
 
 class Button(GUIElement):
     """A clickable button."""
     
+    __slots__ = ('callback', 'font', 'pressed', '_text', '_text_surface', '_text_rect')
+    
+    EVENT_TYPES = (pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP)
+    
     def __init__(self, x: int, y: int, width: int, height: int, text: str, 
                  callback: Optional[Callable[[], None]] = None):
         super().__init__(x, y, width, height)
-        self.text = text
         self.callback = callback
-        self.font = pygame.font.Font(None, UIConfig.DEFAULT_FONT_SIZE)
+        self.font = get_font(UIConfig.DEFAULT_FONT_SIZE)
         self.pressed = False
+        self._text: Optional[str] = None
+        self.text = text
+    
+    @property
+    def text(self) -> str:
+        """Button label."""
+        return self._text
+    
+    @text.setter
+    def text(self, text: str) -> None:
+        # Render and center the label here so draw() only blits it
+        if text == self._text:
+            return
+        self._text = text
+        self._text_surface = _render_text(self.font, text, UIConfig.TEXT_COLOR)
+        self._text_rect = self._text_surface.get_rect(center=self.rect.center)
         
     def handle_event(self, event: pygame.event.Event) -> bool:
         if not self.visible:
@@ -61,48 +182,82 @@ class Button(GUIElement):
         if event.type == pygame.MOUSEBUTTONDOWN:
             if self.rect.collidepoint(event.pos):
                 self.pressed = True
-                logger.debug(f"Button '{self.text}' pressed")
+                if logging_config.DEBUG_ENABLED:
+                    logger.debug("Button '%s' pressed", self.text)
                 return True
         elif event.type == pygame.MOUSEBUTTONUP:
             if self.pressed and self.rect.collidepoint(event.pos):
                 if self.callback:
-                    logger.debug(f"Button '{self.text}' clicked")
+                    if logging_config.DEBUG_ENABLED:
+                        logger.debug("Button '%s' clicked", self.text)
                     self.callback()
                 self.pressed = False
                 return True
             self.pressed = False
         return False
     
-    def draw(self, screen: pygame.Surface) -> None:
+    def appearance(self) -> Tuple[Any, ...]:
+        return (self.visible, self.text, self.pressed)
+    
+    def get_blits(self) -> List[BlitItem]:
         if not self.visible:
-            return
+            return []
             
         # Button color based on state
-        color = UIConfig.BUTTON_PRESSED_COLOR if self.pressed else UIConfig.BUTTON_COLOR
-        
-        pygame.draw.rect(screen, color, self.rect)
-        pygame.draw.rect(screen, UIConfig.BORDER_COLOR, self.rect, 2)
-        
-        # Center text
-        text_surface = self.font.render(self.text, True, UIConfig.TEXT_COLOR)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        screen.blit(text_surface, text_rect)
+        color = _BUTTON_PRESSED_COLOR if self.pressed else _BUTTON_COLOR
+        return [(_frame_surface(self.rect.size, color, _BORDER_COLOR), self.rect),
+                (self._text_surface, self._text_rect)]
 
 
 class InputField(GUIElement):
     """A text input field."""
     
+    __slots__ = ('text', 'max_length', 'font', 'cursor_pos', 'cursor_visible', 'cursor_timer',
+                 '_clip_rect', '_placeholder', '_placeholder_layout', '_text_layout',
+                 '_rendered_text', '_prefix_widths')
+    
+    EVENT_TYPES = (pygame.MOUSEBUTTONDOWN, pygame.KEYDOWN)
+    
     def __init__(self, x: int, y: int, width: int, height: int, 
                  placeholder: str = "", max_length: int = 20):
         super().__init__(x, y, width, height)
         self.text = ""
-        self.placeholder = placeholder
         self.max_length = max_length
-        self.font = pygame.font.Font(None, UIConfig.SMALL_FONT_SIZE)
+        self.font = get_font(UIConfig.SMALL_FONT_SIZE)
+        self._clip_rect = pygame.Rect(x, y, width - 10, height)  # Text is clipped to this
+        self.placeholder = placeholder
         self.cursor_pos = 0
         self.cursor_visible = True
         self.cursor_timer = 0.0
         
+        # Typed text is only re-rendered, placed and re-measured when it changes
+        self._text_layout: Optional[BlitItem] = None
+        self._rendered_text: Optional[str] = None
+        self._prefix_widths: List[int] = [0]  # Width of text[:i] for each cursor position i
+    
+    @property
+    def placeholder(self) -> str:
+        """Hint shown while the field is empty."""
+        return self._placeholder
+    
+    @placeholder.setter
+    def placeholder(self, placeholder: str) -> None:
+        self._placeholder = placeholder
+        self._placeholder_layout = self._place_text(
+            _render_text(self.font, placeholder, (128, 128, 128)))
+    
+    def _place_text(self, text_surface: pygame.Surface) -> BlitItem:
+        """Get the blit that draws text in the field, clipped to the clip rect."""
+        text_rect = text_surface.get_rect()
+        text_rect.centery = self.rect.centery
+        text_rect.x = self.rect.x + 5
+        if self._clip_rect.contains(text_rect):
+            return (text_surface, text_rect)
+        
+        # Blit only the visible part of the text instead of setting a clip
+        visible = text_rect.clip(self._clip_rect)
+        return (text_surface, visible, visible.move(-text_rect.x, -text_rect.y))
+        
     def handle_event(self, event: pygame.event.Event) -> bool:
         if not self.visible:
             return False
@@ -111,86 +266,134 @@ class InputField(GUIElement):
             was_active = self.active
             self.active = self.rect.collidepoint(event.pos)
             if self.active and not was_active:
-                logger.debug("Input field activated")
+                if logging_config.DEBUG_ENABLED:
+                    logger.debug("Input field activated")
+            elif was_active and not self.active:
+                # Start the next focus with a fresh blink
+                self.cursor_timer = 0.0
             return self.active
         elif event.type == pygame.KEYDOWN and self.active:
-            if event.key == pygame.K_BACKSPACE:
-                if self.cursor_pos > 0:
-                    self.text = self.text[:self.cursor_pos-1] + self.text[self.cursor_pos:]
-                    self.cursor_pos -= 1
-            elif event.key == pygame.K_DELETE:
-                if self.cursor_pos < len(self.text):
-                    self.text = self.text[:self.cursor_pos] + self.text[self.cursor_pos+1:]
-            elif event.key == pygame.K_LEFT:
-                self.cursor_pos = max(0, self.cursor_pos - 1)
-            elif event.key == pygame.K_RIGHT:
-                self.cursor_pos = min(len(self.text), self.cursor_pos + 1)
-            elif event.key == pygame.K_HOME:
-                self.cursor_pos = 0
-            elif event.key == pygame.K_END:
-                self.cursor_pos = len(self.text)
+            handler = _INPUT_KEY_HANDLERS.get(event.key)
+            if handler:
+                handler(self)
             elif len(self.text) < self.max_length:
+                # Modifier keys arrive with an empty string, which is printable
                 char = event.unicode
-                if char.isprintable():
-                    self.text = self.text[:self.cursor_pos] + char + self.text[self.cursor_pos:]
-                    self.cursor_pos += 1
+                if char and char.isprintable():
+                    self._insert(char)
             return True
         return False
     
+    def _insert(self, char: str) -> None:
+        self.text = self.text[:self.cursor_pos] + char + self.text[self.cursor_pos:]
+        self.cursor_pos += 1
+    
+    def _backspace(self) -> None:
+        if self.cursor_pos > 0:
+            self.text = self.text[:self.cursor_pos-1] + self.text[self.cursor_pos:]
+            self.cursor_pos -= 1
+    
+    def _delete(self) -> None:
+        if self.cursor_pos < len(self.text):
+            self.text = self.text[:self.cursor_pos] + self.text[self.cursor_pos+1:]
+    
+    def _left(self) -> None:
+        self.cursor_pos = max(0, self.cursor_pos - 1)
+    
+    def _right(self) -> None:
+        self.cursor_pos = min(len(self.text), self.cursor_pos + 1)
+    
+    def _home(self) -> None:
+        self.cursor_pos = 0
+    
+    def _end(self) -> None:
+        self.cursor_pos = len(self.text)
+    
+    def appearance(self) -> Tuple[Any, ...]:
+        return (self.visible, self.text, self.placeholder, self.active,
+                self.cursor_visible, self.cursor_pos)
+    
     def update(self, dt: float) -> None:
+        # The cursor only blinks while the field has focus
+        if not self.active:
+            self.cursor_visible = True
+            return
+        
         # Cursor blinking
         self.cursor_timer += dt
         if self.cursor_timer >= 0.5:
             self.cursor_visible = not self.cursor_visible
             self.cursor_timer = 0.0
+            self.dirty = True
     
-    def draw(self, screen: pygame.Surface) -> None:
+    def get_blits(self) -> List[BlitItem]:
         if not self.visible:
-            return
+            return []
             
         # Background
         bg_color = (255, 255, 255) if self.active else (230, 230, 230)
         border_color = (100, 150, 255) if self.active else (150, 150, 150)
-        
-        pygame.draw.rect(screen, bg_color, self.rect)
-        pygame.draw.rect(screen, border_color, self.rect, 2)
+        blits = [(_frame_surface(self.rect.size, bg_color, border_color), self.rect)]
         
         # Text
-        display_text = self.text if self.text else self.placeholder
-        text_color = (0, 0, 0) if self.text else (128, 128, 128)
-        
-        text_surface = self.font.render(display_text, True, text_color)
-        text_rect = text_surface.get_rect()
-        text_rect.centery = self.rect.centery
-        text_rect.x = self.rect.x + 5
+        if not self.text:
+            blits.append(self._placeholder_layout)
+            return blits
         
-        # Clip text to field
-        clip_rect = self.rect.copy()
-        clip_rect.width -= 10
-        screen.set_clip(clip_rect)
-        screen.blit(text_surface, text_rect)
-        screen.set_clip(None)
+        if self.text != self._rendered_text:
+            self._text_layout = self._place_text(
+                _render_text(self.font, self.text, (0, 0, 0)))
+            # Measure whole prefixes so kerning matches the rendered text
+            self._prefix_widths = [self.font.size(self.text[:i])[0]
+                                   for i in range(len(self.text) + 1)]
+            self._rendered_text = self.text
+        blits.append(self._text_layout)
         
         # Cursor
-        if self.active and self.cursor_visible and self.text:
-            cursor_text = self.text[:self.cursor_pos]
-            cursor_width = self.font.size(cursor_text)[0]
-            cursor_x = self.rect.x + 5 + cursor_width
-            cursor_y1 = self.rect.y + 3
-            cursor_y2 = self.rect.y + self.rect.height - 3
-            pygame.draw.line(screen, (0, 0, 0), (cursor_x, cursor_y1), (cursor_x, cursor_y2), 1)
+        if self.active and self.cursor_visible:
+            cursor_x = self.rect.x + 5 + self._prefix_widths[self.cursor_pos]
+            blits.append((_cursor_surface(self.rect.height - 5), (cursor_x, self.rect.y + 3)))
+        return blits
+
+
+# Editing keys handled by InputField; other keys type their character
+_INPUT_KEY_HANDLERS: Dict[int, Callable[[InputField], None]] = {
+    pygame.K_BACKSPACE: InputField._backspace,
+    pygame.K_DELETE: InputField._delete,
+    pygame.K_LEFT: InputField._left,
+    pygame.K_RIGHT: InputField._right,
+    pygame.K_HOME: InputField._home,
+    pygame.K_END: InputField._end,
+}
 
 
 class Checkbox(GUIElement):
     """A checkbox element."""
     
+    __slots__ = ('checked', 'callback', 'font', '_text', '_text_surface', '_text_rect')
+    
+    EVENT_TYPES = (pygame.MOUSEBUTTONDOWN,)
+    
     def __init__(self, x: int, y: int, size: int, text: str, 
                  checked: bool = False, callback: Optional[Callable[[bool], None]] = None):
         super().__init__(x, y, size, size)
-        self.text = text
         self.checked = checked
         self.callback = callback
-        self.font = pygame.font.Font(None, UIConfig.SMALL_FONT_SIZE)
+        self.font = get_font(UIConfig.SMALL_FONT_SIZE)
+        self.text = text
+    
+    @property
+    def text(self) -> str:
+        """Label drawn to the right of the box."""
+        return self._text
+    
+    @text.setter
+    def text(self, text: str) -> None:
+        self._text = text
+        self._text_surface = _render_text(self.font, text, UIConfig.TEXT_COLOR)
+        self._text_rect = self._text_surface.get_rect()
+        self._text_rect.centery = self.rect.centery
+        self._text_rect.x = self.rect.right + 10
         
     def handle_event(self, event: pygame.event.Event) -> bool:
         if not self.visible:
@@ -199,35 +402,25 @@ class Checkbox(GUIElement):
         if event.type == pygame.MOUSEBUTTONDOWN:
             if self.rect.collidepoint(event.pos):
                 self.checked = not self.checked
-                logger.debug(f"Checkbox '{self.text}' toggled to {self.checked}")
+                if logging_config.DEBUG_ENABLED:
+                    logger.debug("Checkbox '%s' toggled to %s", self.text, self.checked)
                 if self.callback:
                     self.callback(self.checked)
                 return True
         return False
     
-    def draw(self, screen: pygame.Surface) -> None:
+    def appearance(self) -> Tuple[Any, ...]:
+        return (self.visible, self.text, self.checked)
+    
+    def bounds(self) -> pygame.Rect:
+        # Include the label drawn to the right of the box
+        return self.rect.union(pygame.Rect(self.rect.right + 10, self.rect.y - 10,
+                                           self._text_rect.width, self.rect.height + 20))
+    
+    def get_blits(self) -> List[BlitItem]:
         if not self.visible:
-            return
+            return []
             
-        # Checkbox
-        color = (255, 255, 255)
-        border_color = (150, 150, 150)
-        
-        pygame.draw.rect(screen, color, self.rect)
-        pygame.draw.rect(screen, border_color, self.rect, 2)
-        
-        # Checkmark
-        if self.checked:
-            points = [
-                (self.rect.x + 3, self.rect.y + self.rect.height // 2),
-                (self.rect.x + self.rect.width // 2, self.rect.y + self.rect.height - 4),
-                (self.rect.x + self.rect.width - 3, self.rect.y + 3)
-            ]
-            pygame.draw.lines(screen, (0, 150, 0), False, points, 3)
-        
-        # Text
-        text_surface = self.font.render(self.text, True, UIConfig.TEXT_COLOR)
-        text_rect = text_surface.get_rect()
-        text_rect.centery = self.rect.centery
-        text_rect.x = self.rect.right + 10
-        screen.blit(text_surface, text_rect) 
\ No newline at end of file
+        # Checkbox and checkmark, then the label
+        return [(_checkbox_surface(self.rect.size, self.checked), self.rect),
+                (self._text_surface, self._text_rect)]
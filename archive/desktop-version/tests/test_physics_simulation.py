@@ -0,0 +1,86 @@
+"""
+Test suite for the desktop physics_simulation module.
+
+Tests the history ring used for stepping back and rewinding.
+"""
+
+import unittest
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from simulation.physics_simulation import PhysicsSimulation
+
+
+class TestHistory(unittest.TestCase):
+    """Test cases for saving and stepping back through history."""
+
+    def test_step_back_restores_frame(self):
+        """Test that stepping back restores the ball and time of an earlier frame."""
+        simulation = PhysicsSimulation(800, 600, "physics")
+        simulation.step_simulation_frames(29)
+        saved_time = simulation.simulation_time
+        saved_y = simulation.ball.y
+        saved_velocity = simulation.ball.velocity_y
+
+        # Of the 50 saved frames, the newest one left is the 30th
+        simulation.step_simulation_frames(21)
+        simulation.step_simulation_frames(-20)
+
+        self.assertEqual(simulation.simulation_time, saved_time)
+        self.assertEqual(simulation.ball.y, saved_y)
+        self.assertEqual(simulation.ball.velocity_y, saved_velocity)
+        self.assertEqual(simulation.get_history_info()['frames_stored'], 30)
+
+    def test_history_keeps_newest_frames(self):
+        """Test that stepping past the history limit keeps the newest frames."""
+        simulation = PhysicsSimulation(800, 600, "physics")
+        max_frames = simulation.get_history_info()['max_frames']
+
+        simulation.step_simulation_frames(max_frames + 25)
+
+        self.assertEqual(simulation.get_history_info()['frames_stored'], max_frames)
+
+
+class TestRewindToTime(unittest.TestCase):
+    """Test cases for rewinding to the closest saved time."""
+
+    def test_rewinds_to_closest_frame(self):
+        """Test that rewinding picks the nearest saved frame."""
+        simulation = PhysicsSimulation(800, 600, "physics")
+        simulation.step_simulation_frames(40)
+        saved_time = simulation.simulation_time
+        simulation.step_simulation_frames(80)
+
+        simulation.rewind_to_time(saved_time + simulation.dt * 0.4)
+
+        self.assertEqual(simulation.simulation_time, saved_time)
+        self.assertEqual(simulation.get_history_info()['frames_stored'], 41)
+
+    def test_rewinds_across_wrapped_history(self):
+        """Test that the search covers both halves of a full history buffer."""
+        max_frames = PhysicsSimulation(800, 600, "physics").get_history_info()['max_frames']
+        total_frames = max_frames + max_frames // 2
+        oldest_frame = total_frames - max_frames
+
+        # Once wrapped, the oldest frame sits mid-buffer: index 10 is in the
+        # run up to the end of the buffer, the other index past the wrap
+        for index in (10, max_frames // 2 + 10):
+            simulation = PhysicsSimulation(800, 600, "physics")
+            simulation.step_simulation_frames(oldest_frame + index)
+            saved_time = simulation.simulation_time
+            saved_y = simulation.ball.y
+            simulation.step_simulation_frames(total_frames - oldest_frame - index)
+
+            simulation.rewind_to_time(saved_time - simulation.dt * 0.4)
+
+            self.assertEqual(simulation.simulation_time, saved_time)
+            self.assertEqual(simulation.ball.y, saved_y)
+            self.assertEqual(simulation.get_history_info()['frames_stored'], index + 1)
+
+
+if __name__ == '__main__':
+    # Run the tests
+    unittest.main()
@@ -2,9 +2,17 @@
 Logging configuration for the physics simulation.
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
-from typing import Optional
+from typing import List, Optional
+
+from .constants import LoggingConfig
+
+# Writes queued records to the real handlers on its own thread
+_listener: Optional[logging.handlers.QueueListener] = None
 
 
 def setup_logging(level: str = "INFO", log_file: Optional[str] = None) -> None:
@@ -15,6 +23,8 @@ def setup_logging(level: str = "INFO", log_file: Optional[str] = None) -> None:
         level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Optional file path to write logs to
     """
+    global _listener
+    
     # Convert string level to logging constant
     numeric_level = getattr(logging, level.upper(), logging.INFO)
     
@@ -29,23 +39,45 @@ def setup_logging(level: str = "INFO", log_file: Optional[str] = None) -> None:
     
     # Clear existing handlers
     logger.handlers.clear()
+    stop_logging()
     
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(numeric_level)
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers: List[logging.Handler] = [console_handler]
     
-    # File handler (optional)
+    # File handler (optional), rotated so the log cannot grow without bound
     if log_file:
-        file_handler = logging.FileHandler(log_file)
+        file_handler = logging.handlers.RotatingFileHandler(
+            log_file, maxBytes=LoggingConfig.MAX_LOG_SIZE,
+            backupCount=LoggingConfig.BACKUP_COUNT
+        )
         file_handler.setLevel(numeric_level)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    # Logging calls only enqueue the record; the listener thread does the I/O
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _listener = logging.handlers.QueueListener(log_queue, *handlers,
+                                               respect_handler_level=True)
+    _listener.start()
     
     # Note: pygame logging suppression removed since pygame is not used in web context
 
 
+def stop_logging() -> None:
+    """Write out queued log records and stop the listener thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(stop_logging)
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger with the specified name."""
     return logging.getLogger(name)
\ No newline at end of file
@@ -4,7 +4,7 @@ Physics Module
 Contains physics-related classes and calculations for the simulation.
 """
 
-from .ball import Ball
+from .ball import Ball, BallState
 from .constants import PhysicsConstants
 
-__all__ = ['Ball', 'PhysicsConstants']
\ No newline at end of file
+__all__ = ['Ball', 'BallState', 'PhysicsConstants']
\ No newline at end of file
@@ -4,25 +4,32 @@ Unified Ball Physics Class
 A ball object with vertical motion simulation that can work with different coordinate systems.
 """
 
-from typing import Dict, Any, Optional, Tuple
+from typing import Dict, Any, List, NamedTuple, Optional, Tuple
 
-try:
-    from .constants import PhysicsConstants
-    from ..config.constants import SimulationConfig
-    from ..config.logging_config import get_logger
-except ImportError:
-    # Fallback for direct execution
-    from physics.constants import PhysicsConstants
-    from config.constants import SimulationConfig
-    from config.logging_config import get_logger
+from config.constants import SimulationConfig
+from config.logging_config import get_logger
+
+from .constants import PhysicsConstants
+from .integrator import integrate_physics, integrate_screen
 
 logger = get_logger(__name__)
 
 
+class BallState(NamedTuple):
+    """Snapshot of the ball's motion, as stored in simulation history."""
+    x: float
+    y: float
+    velocity_y: float
+    acceleration_y: float
+
+
 class Ball:
     """A physics-based ball object with vertical motion simulation."""
     
-    def __init__(self, x: float, y: float, radius: float = None, mass: float = None, 
+    __slots__ = ('x', 'y', 'radius', 'mass', 'coordinate_system', 'velocity_y', 'acceleration_y',
+                 'gravity', 'bounce_damping', 'min_bounce_velocity')
+    
+    def __init__(self, x: float, y: float, radius: Optional[float] = None, mass: Optional[float] = None, 
                  coordinate_system: str = "screen"):
         """
         Initialize a ball object.
@@ -78,11 +85,11 @@ class Ball:
                 raise ValueError("ground_y is required for screen coordinate system")
             is_at_rest = self.velocity_y == 0 and self.y + self.radius >= ground_y
         
-        # Apply gravity if not at rest
-        if not is_at_rest:
-            self.acceleration_y = self.gravity
-        else:
-            self.acceleration_y = 0
+        # A resting ball stays put; the kinematic update would only add zeros
+        if is_at_rest:
+            self.acceleration_y = 0.0
+            return
+        self.acceleration_y = self.gravity
         
         # Update velocity and position using kinematic equations
         self.velocity_y += self.acceleration_y * dt
@@ -102,7 +109,7 @@ class Ball:
                 self.velocity_y = -self.velocity_y * self.bounce_damping
                 
                 if abs(self.velocity_y) < self.min_bounce_velocity:
-                    self.velocity_y = 0
+                    self.velocity_y = 0.0
         else:
             # Screen coordinates: ground is at ground_y
             if ground_y is None:
@@ -113,10 +120,39 @@ class Ball:
                 self.velocity_y = -self.velocity_y * self.bounce_damping
                 
                 if abs(self.velocity_y) < self.min_bounce_velocity:
-                    self.velocity_y = 0
+                    self.velocity_y = 0.0
     
 
     
+    def advance(self, dt: float, steps: int, ground_y: Optional[float],
+                ys: List[float], velocities: List[float], accelerations: List[float]) -> None:
+        """
+        Update the ball for several time steps at once.
+        
+        Gives exactly the same result as calling update() and
+        check_ground_collision() once per step.
+        
+        Args:
+            dt: Time step in seconds
+            steps: Number of time steps
+            ground_y: Ground position (only needed for screen coordinates)
+            ys: Receives y before each step
+            velocities: Receives velocity_y before each step
+            accelerations: Receives acceleration_y before each step
+        """
+        if self.coordinate_system == "physics":
+            self.y, self.velocity_y, self.acceleration_y = integrate_physics(
+                self.y, self.velocity_y, self.acceleration_y, steps, dt,
+                self.gravity, self.radius, self.bounce_damping, self.min_bounce_velocity,
+                ys, velocities, accelerations)
+        else:
+            if ground_y is None:
+                raise ValueError("ground_y is required for screen coordinate system")
+            self.y, self.velocity_y, self.acceleration_y = integrate_screen(
+                self.y, self.velocity_y, self.acceleration_y, steps, dt,
+                self.gravity, self.radius, self.bounce_damping, self.min_bounce_velocity,
+                ground_y, ys, velocities, accelerations)
+    
     def get_state(self) -> Dict[str, Any]:
         """Get the current state of the ball."""
         return {
@@ -129,6 +165,14 @@ class Ball:
             'coordinate_system': self.coordinate_system
         }
     
+    def snapshot(self) -> BallState:
+        """Capture the ball's motion without building a dictionary."""
+        return BallState(self.x, self.y, self.velocity_y, self.acceleration_y)
+    
+    def restore(self, state: BallState) -> None:
+        """Return the ball to a snapshot taken with snapshot()."""
+        self.x, self.y, self.velocity_y, self.acceleration_y = state
+    
     def set_state(self, state: Dict[str, Any]) -> None:
         """Set the ball's state from a dictionary."""
         self.x = state['x']
@@ -0,0 +1,112 @@
+"""
+Integrator
+
+Fixed-step integration of a ball falling onto the ground.
+
+Each function runs the same arithmetic as Ball.update() followed by
+Ball.check_ground_collision(), but on local variables, so any number of steps
+lands exactly where stepping the ball one frame at a time would. The state
+before each step is appended to the given lists. Once the ball comes to rest
+the state no longer changes, so the remaining steps are filled in directly.
+"""
+
+from itertools import repeat
+from typing import List, Tuple
+
+
+def _repeat_rest(y: float, count: int, ys: List[float], velocities: List[float],
+                 accelerations: List[float]) -> None:
+    """Append count steps of a ball resting at y."""
+    ys.extend(repeat(y, count))
+    velocities.extend(repeat(0.0, count))
+    accelerations.extend(repeat(0.0, count))
+
+
+def integrate_physics(y: float, velocity_y: float, acceleration_y: float,
+                      steps: int, dt: float, gravity: float, radius: float,
+                      bounce_damping: float, min_bounce_velocity: float,
+                      ys: List[float], velocities: List[float],
+                      accelerations: List[float]) -> Tuple[float, float, float]:
+    """
+    Integrate in physics coordinates, where the ground is at y=0.
+    
+    Args:
+        y: Ball center height
+        velocity_y: Vertical velocity
+        acceleration_y: Vertical acceleration
+        steps: Number of time steps
+        dt: Time step in seconds
+        gravity: Acceleration while the ball is not resting
+        radius: Ball radius
+        bounce_damping: Fraction of speed kept after a bounce
+        min_bounce_velocity: Bounce speed below which the ball comes to rest
+        ys: Receives y before each step
+        velocities: Receives velocity_y before each step
+        accelerations: Receives acceleration_y before each step
+    
+    Returns:
+        Tuple of (y, velocity_y, acceleration_y) after the last step
+    """
+    append_y = ys.append
+    append_velocity = velocities.append
+    append_acceleration = accelerations.append
+    for step in range(steps):
+        append_y(y)
+        append_velocity(velocity_y)
+        append_acceleration(acceleration_y)
+        
+        acceleration_y = 0.0 if velocity_y == 0 and y <= radius else gravity
+        velocity_y += acceleration_y * dt
+        y += velocity_y * dt
+        
+        if y <= radius:
+            y = radius
+            velocity_y = -velocity_y * bounce_damping
+            if abs(velocity_y) < min_bounce_velocity:
+                velocity_y = 0.0
+                if acceleration_y == 0.0:
+                    # At rest: every remaining step repeats this state
+                    _repeat_rest(y, steps - step - 1, ys, velocities, accelerations)
+                    break
+    
+    return y, velocity_y, acceleration_y
+
+
+def integrate_screen(y: float, velocity_y: float, acceleration_y: float,
+                     steps: int, dt: float, gravity: float, radius: float,
+                     bounce_damping: float, min_bounce_velocity: float, ground_y: float,
+                     ys: List[float], velocities: List[float],
+                     accelerations: List[float]) -> Tuple[float, float, float]:
+    """
+    Integrate in screen coordinates, where y increases downward to ground_y.
+    
+    Takes the same arguments as integrate_physics(), plus the ground position.
+    
+    Returns:
+        Tuple of (y, velocity_y, acceleration_y) after the last step
+    """
+    append_y = ys.append
+    append_velocity = velocities.append
+    append_acceleration = accelerations.append
+    for step in range(steps):
+        append_y(y)
+        append_velocity(velocity_y)
+        append_acceleration(acceleration_y)
+        
+        acceleration_y = 0.0 if velocity_y == 0 and y + radius >= ground_y else gravity
+        velocity_y += acceleration_y * dt
+        y += velocity_y * dt
+        
+        if y + radius >= ground_y:
+            y = ground_y - radius
+            velocity_y = -velocity_y * bounce_damping
+            if abs(velocity_y) < min_bounce_velocity:
+                velocity_y = 0.0
+                # Rounding can leave the clamped y just above the ground, so
+                # check it still counts as resting before repeating it
+                if acceleration_y == 0.0 and y + radius >= ground_y:
+                    # At rest: every remaining step repeats this state
+                    _repeat_rest(y, steps - step - 1, ys, velocities, accelerations)
+                    break
+    
+    return y, velocity_y, acceleration_y
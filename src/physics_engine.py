@@ -60,11 +60,10 @@ class PhysicsSimulation(BasePhysicsSimulation):
         normalized_y = (canvas_height - canvas_y) / canvas_height
         return bounds['min_y'] + (normalized_y * (bounds['max_y'] - bounds['min_y']))
     
-    def get_state(self) -> Dict[str, Any]:
-        """Get current simulation state with viewport information."""
-        state = super().get_state()
-        state['viewport'] = self.get_viewport_bounds()
-        return state
+    def _refresh_state(self) -> None:
+        """Build the cached state with viewport information."""
+        super()._refresh_state()
+        self._state_cache['viewport'] = self.get_viewport_bounds()
     
     def set_start_y(self, start_y: float = 400) -> Dict[str, Any]:
         """
@@ -4,10 +4,12 @@ Physics Simulation Module
 Core simulation logic separated from rendering and UI concerns.
 """
 
+from array import array
+from bisect import bisect_left
 from typing import Dict, Any, List, Tuple, Optional
-from collections import deque
+from itertools import accumulate, repeat
 
-from physics import Ball
+from physics import Ball, BallState
 from config.constants import SimulationConfig
 from config.logging_config import get_logger
 
@@ -17,7 +19,7 @@ logger = get_logger(__name__)
 class PhysicsSimulation:
     """Core physics simulation class responsible for time control and state management."""
     
-    def __init__(self, width: int = None, height: int = None, coordinate_system: str = "screen"):
+    def __init__(self, width: Optional[int] = None, height: Optional[int] = None, coordinate_system: str = "screen"):
         """
         Initialize the physics simulation.
         
@@ -30,16 +32,21 @@ class PhysicsSimulation:
         self.height = height or SimulationConfig.DEFAULT_HEIGHT
         self.coordinate_system = coordinate_system
         
-        # Calculate ground position
+        # Calculate ground position, and pick the coordinate-specific ball
+        # calls once since the coordinate system never changes
         if coordinate_system == "screen":
             self.ground_y = self.height - SimulationConfig.GROUND_OFFSET
-            initial_ball_y = SimulationConfig.DEFAULT_SCREEN_START_Y  # Near top of screen
+            self.initial_ball_y = SimulationConfig.DEFAULT_SCREEN_START_Y  # Near top of screen
+            self._step_ball = self._step_ball_screen
+            self._ball_energy = self._ball_energy_screen
         else:
             self.ground_y = 0  # Physics coordinates
-            initial_ball_y = SimulationConfig.DEFAULT_PHYSICS_START_Y  # Above ground in physics coordinates
+            self.initial_ball_y = SimulationConfig.DEFAULT_PHYSICS_START_Y  # Above ground in physics coordinates
+            self._step_ball = self._step_ball_physics
+            self._ball_energy = self._ball_energy_physics
         
         # Create ball
-        self.ball = Ball(self.width // 2, initial_ball_y, coordinate_system=coordinate_system)
+        self.ball = Ball(self.width // 2, self.initial_ball_y, coordinate_system=coordinate_system)
         
         # Time control properties
         self.simulation_time = 0.0
@@ -48,39 +55,163 @@ class PhysicsSimulation:
         self.dt = 1 / self.target_fps
         self.auto_pause_after_step = False
         
-        # State management
-        self.history = deque(maxlen=SimulationConfig.MAX_HISTORY_FRAMES)
-        self.time_history = deque(maxlen=SimulationConfig.MAX_HISTORY_FRAMES)
+        # State management: a fixed-size ring of saved frames, one array per field
+        self.max_history_frames = SimulationConfig.MAX_HISTORY_FRAMES
+        self._hist_time = array('d', [0.0]) * self.max_history_frames
+        self._hist_x = array('d', [0.0]) * self.max_history_frames
+        self._hist_y = array('d', [0.0]) * self.max_history_frames
+        self._hist_vy = array('d', [0.0]) * self.max_history_frames
+        self._hist_ay = array('d', [0.0]) * self.max_history_frames
+        self._hist_head = 0  # Slot the next frame is written to
+        self._hist_count = 0
         
         # Step control
         self.step_by_frames = False
         
+        # Cached get_state() result, rebuilt only after the simulation changes
+        self._state_cache: Dict[str, Any] = {}
+        self._state_dirty = True
+        
         logger.info(f"Created PhysicsSimulation: {self.width}x{self.height}, {coordinate_system} coordinates")
     
     def update(self) -> Dict[str, Any]:
         """Update simulation by one time step."""
         if self.is_playing:
             self.save_state()
-            
-            if self.coordinate_system == "screen":
-                self.ball.update(self.dt, self.ground_y)
-                self.ball.check_ground_collision(self.ground_y)
-            else:
-                self.ball.update(self.dt)
-                self.ball.check_ground_collision()
-            
+            self._step_ball(self.dt)
             self.simulation_time += self.dt
+            self._invalidate()
             
         return self.get_state()
     
+    def _step_ball_screen(self, dt: float) -> None:
+        """Advance the ball one step in screen coordinates."""
+        self.ball.update(dt, self.ground_y)
+        self.ball.check_ground_collision(self.ground_y)
+    
+    def _step_ball_physics(self, dt: float) -> None:
+        """Advance the ball one step in physics coordinates."""
+        self.ball.update(dt)
+        self.ball.check_ground_collision()
+    
+    def _ball_energy_screen(self) -> Tuple[float, float, float]:
+        """Get the ball's energy in screen coordinates."""
+        return self.ball.get_energy(self.ground_y)
+    
+    def _ball_energy_physics(self) -> Tuple[float, float, float]:
+        """Get the ball's energy in physics coordinates."""
+        return self.ball.get_energy()
+    
     def save_state(self) -> None:
         """Save the current state to history."""
-        self.history.append(self.ball.get_state())
-        self.time_history.append(self.simulation_time)
+        head = self._hist_head
+        ball = self.ball
+        self._hist_time[head] = self.simulation_time
+        self._hist_x[head] = ball.x
+        self._hist_y[head] = ball.y
+        self._hist_vy[head] = ball.velocity_y
+        self._hist_ay[head] = ball.acceleration_y
+        self._hist_head = (head + 1) % self.max_history_frames
+        if self._hist_count < self.max_history_frames:
+            self._hist_count += 1
+    
+    def _advance_frames(self, frame_count: int) -> None:
+        """Step the ball forward, saving the state before each frame into history."""
+        times = list(accumulate(repeat(self.dt, frame_count), initial=self.simulation_time))
+        x = self.ball.x
+        size = self.max_history_frames
+        head = self._hist_head
+        
+        # Integrate one contiguous run of ring slots at a time; runs longer
+        # than the ring simply overwrite their own oldest frames
+        done = 0
+        while done < frame_count:
+            run = min(frame_count - done, size - head)
+            ys: List[float] = []
+            velocities: List[float] = []
+            accelerations: List[float] = []
+            self.ball.advance(self.dt, run, self.ground_y, ys, velocities, accelerations)
+            
+            end = head + run
+            self._hist_time[head:end] = array('d', times[done:done + run])
+            self._hist_x[head:end] = array('d', [x]) * run
+            self._hist_y[head:end] = array('d', ys)
+            self._hist_vy[head:end] = array('d', velocities)
+            self._hist_ay[head:end] = array('d', accelerations)
+            head = end % size
+            done += run
+        
+        self._hist_head = head
+        self._hist_count = min(self._hist_count + frame_count, size)
+        self.simulation_time = times[-1]
+    
+    def _history_slot(self, index: int) -> int:
+        """Map a history index (0 is oldest, -1 is newest) to its ring slot."""
+        if index < 0:
+            index += self._hist_count
+        return (self._hist_head - self._hist_count + index) % self.max_history_frames
+    
+    def _time_at(self, index: int) -> float:
+        """Get the simulation time of a saved frame."""
+        return self._hist_time[self._history_slot(index)]
+    
+    def _state_at(self, index: int) -> BallState:
+        """Rebuild the ball state of a saved frame."""
+        slot = self._history_slot(index)
+        return BallState(self._hist_x[slot], self._hist_y[slot],
+                         self._hist_vy[slot], self._hist_ay[slot])
+    
+    def _truncate_history(self, count: int) -> None:
+        """Keep only the oldest `count` saved frames."""
+        self._hist_head = (self._hist_head - self._hist_count + count) % self.max_history_frames
+        self._hist_count = count
+    
+    def _search_time(self, target_time: float) -> int:
+        """
+        Find the first saved frame at or after a time.
+        
+        Saved times increase from oldest to newest, so the ring is searched as
+        two sorted runs: from the oldest slot to the end of the buffer, then
+        from the start of the buffer.
+        
+        Returns:
+            History index of that frame, or the frame count if every saved
+            frame is earlier
+        """
+        times = self._hist_time
+        start = self._history_slot(0)
+        first_run = min(self._hist_count, self.max_history_frames - start)
+        
+        index = bisect_left(times, target_time, start, start + first_run) - start
+        if index < first_run:
+            return index
+        return first_run + bisect_left(times, target_time, 0, self._hist_count - first_run)
+    
+    def _clear_history(self) -> None:
+        """Drop all saved frames."""
+        self._hist_head = 0
+        self._hist_count = 0
+    
+    def _invalidate(self) -> None:
+        """Mark the cached state as stale after the simulation changes."""
+        self._state_dirty = True
     
     def get_state(self) -> Dict[str, Any]:
-        """Get current simulation state."""
-        state = {
+        """
+        Get current simulation state.
+        
+        The same dictionary is returned until the simulation changes. A
+        change builds a new one, so a state already handed out never changes.
+        """
+        if self._state_dirty:
+            self._refresh_state()
+            self._state_dirty = False
+        return self._state_cache
+    
+    def _refresh_state(self) -> None:
+        """Build a new cached state from the current simulation."""
+        kinetic, potential, total = self._ball_energy()
+        self._state_cache = {
             'ball': self.ball.get_state(),
             'time': self.simulation_time,
             'is_playing': self.is_playing,
@@ -89,26 +220,18 @@ class PhysicsSimulation:
             'ground_y': self.ground_y,
             'coordinate_system': self.coordinate_system,
             'step_by_frames': self.step_by_frames,
-            'auto_pause_after_step': self.auto_pause_after_step
-        }
-        
-        # Add energy information
-        if self.coordinate_system == "screen":
-            kinetic, potential, total = self.ball.get_energy(self.ground_y)
-        else:
-            kinetic, potential, total = self.ball.get_energy()
-        
-        state['energy'] = {
-            'kinetic': kinetic,
-            'potential': potential,
-            'total': total
+            'auto_pause_after_step': self.auto_pause_after_step,
+            'energy': {
+                'kinetic': kinetic,
+                'potential': potential,
+                'total': total
+            }
         }
-        
-        return state
     
     def toggle_play_pause(self) -> bool:
         """Toggle between play and pause states."""
         self.is_playing = not self.is_playing
+        self._invalidate()
         logger.debug(f"Simulation {'playing' if self.is_playing else 'paused'}")
         return self.is_playing
     
@@ -117,35 +240,31 @@ class PhysicsSimulation:
         self.simulation_time = 0.0
         self.is_playing = False
         
-        if self.coordinate_system == "screen":
-            initial_y = SimulationConfig.DEFAULT_SCREEN_START_Y
-        else:
-            initial_y = SimulationConfig.DEFAULT_PHYSICS_START_Y
-        
-        self.ball.reset_to_position(self.width // 2, initial_y)
-        self.history.clear()
-        self.time_history.clear()
+        self.ball.reset_to_position(self.width // 2, self.initial_ball_y)
+        self._clear_history()
         
+        self._invalidate()
         logger.info("Simulation reset")
         return self.get_state()
     
     def step_simulation_time(self, time_step: float) -> Dict[str, Any]:
         """Step the simulation by a specific time amount."""
         if time_step > 0:
-            # Step forward
+            # Step forward: whole frames go through the batched path...
             target_time = self.simulation_time + time_step
+            full_frames = 0
+            frame_time = self.simulation_time
+            while target_time - frame_time >= self.dt:
+                frame_time += self.dt
+                full_frames += 1
+            if full_frames:
+                self._advance_frames(full_frames)
+            
+            # ...then a short final step lands on the target time
             while self.simulation_time < target_time:
-                # Don't overshoot the target time
-                remaining_time = target_time - self.simulation_time
-                current_dt = min(self.dt, remaining_time)
-                
+                current_dt = min(self.dt, target_time - self.simulation_time)
                 self.save_state()
-                if self.coordinate_system == "screen":
-                    self.ball.update(current_dt, self.ground_y)
-                    self.ball.check_ground_collision(self.ground_y)
-                else:
-                    self.ball.update(current_dt)
-                    self.ball.check_ground_collision()
+                self._step_ball(current_dt)
                 self.simulation_time += current_dt
         elif time_step < 0:
             # Step backward
@@ -158,47 +277,38 @@ class PhysicsSimulation:
         if self.auto_pause_after_step:
             self.is_playing = False
         
+        self._invalidate()
         logger.debug(f"Stepped simulation by {time_step}s to time {self.simulation_time:.3f}s")
         return self.get_state()
     
     def step_simulation_frames(self, frame_count: int) -> Dict[str, Any]:
         """Step the simulation by a specific number of frames."""
         if frame_count > 0:
-            # Step forward
-            for _ in range(frame_count):
-                self.save_state()
-                if self.coordinate_system == "screen":
-                    self.ball.update(self.dt, self.ground_y)
-                    self.ball.check_ground_collision(self.ground_y)
-                else:
-                    self.ball.update(self.dt)
-                    self.ball.check_ground_collision()
-                self.simulation_time += self.dt
+            # Step forward, saving the state before each frame
+            self._advance_frames(frame_count)
         elif frame_count < 0:
             # Step backward (rewind)
-            frames_to_rewind = min(abs(frame_count), len(self.history))
-            for _ in range(frames_to_rewind):
-                if self.history and self.time_history:
-                    self.history.pop()
-                    self.time_history.pop()
+            frames_to_rewind = min(abs(frame_count), self._hist_count)
+            self._truncate_history(self._hist_count - frames_to_rewind)
             
             # Apply the rewound state
-            if self.history and self.time_history:
-                self.ball.set_state(self.history[-1])
-                self.simulation_time = self.time_history[-1]
+            if self._hist_count:
+                self.ball.restore(self._state_at(-1))
+                self.simulation_time = self._time_at(-1)
             else:
                 self.reset()
         
         if self.auto_pause_after_step:
             self.is_playing = False
         
+        self._invalidate()
         logger.debug(f"Stepped simulation by {frame_count} frames to time {self.simulation_time:.3f}s")
         return self.get_state()
     
     def jump_to_time(self, target_time: float) -> Dict[str, Any]:
         """Jump to a specific time in the simulation."""
         if target_time < 0:
-            target_time = 0
+            target_time = 0.0
         
         if target_time < self.simulation_time:
             # Need to rewind
@@ -214,64 +324,59 @@ class PhysicsSimulation:
         if self.auto_pause_after_step:
             self.is_playing = False
         
+        self._invalidate()
         logger.debug(f"Jumped to time {target_time:.3f}s")
         return self.get_state()
     
     def rewind_to_time(self, target_time: float) -> None:
         """Rewind to the closest available time in history."""
-        if not self.time_history:
+        if not self._hist_count:
             self.reset()
             return
         
-        # Find the closest time in history
-        best_idx = 0
-        best_diff = abs(self.time_history[0] - target_time)
-        
-        for i, t in enumerate(self.time_history):
-            diff = abs(t - target_time)
-            if diff < best_diff:
-                best_diff = diff
-                best_idx = i
+        # Find the closest time in history; on a tie the earliest frame wins
+        best_idx = self._search_time(target_time)
+        if best_idx == self._hist_count or (
+                best_idx > 0 and
+                target_time - self._time_at(best_idx - 1) <= self._time_at(best_idx) - target_time):
+            # A rewound frame is saved again when stepping resumes, so times
+            # can repeat; go back to the first frame with this time
+            best_idx = self._search_time(self._time_at(best_idx - 1))
         
         # Rewind to that state
-        frames_to_rewind = len(self.history) - best_idx - 1
-        if frames_to_rewind > 0:
-            for _ in range(frames_to_rewind):
-                if self.history and self.time_history:
-                    self.history.pop()
-                    self.time_history.pop()
+        self._truncate_history(best_idx + 1)
         
-        if self.history and self.time_history:
-            self.ball.set_state(self.history[-1])
-            self.simulation_time = self.time_history[-1]
+        self.ball.restore(self._state_at(-1))
+        self.simulation_time = self._time_at(-1)
     
     def set_ball_start_position(self, x: float, y: float) -> Dict[str, Any]:
         """Set the ball's starting position and reset."""
         self.simulation_time = 0.0
         self.is_playing = False
         self.ball.reset_to_position(x, y)
-        self.history.clear()
-        self.time_history.clear()
+        self._clear_history()
         
+        self._invalidate()
         logger.debug(f"Set ball start position to ({x}, {y})")
         return self.get_state()
     
     def can_rewind(self) -> bool:
         """Check if there are states available for rewinding."""
-        return len(self.history) > 1
+        return self._hist_count > 1
     
     def get_history_info(self) -> Dict[str, Any]:
         """Get information about the current history state."""
         return {
-            'frames_stored': len(self.history),
-            'max_frames': self.history.maxlen,
-            'time_stored_seconds': len(self.history) / self.target_fps,
+            'frames_stored': self._hist_count,
+            'max_frames': self.max_history_frames,
+            'time_stored_seconds': self._hist_count / self.target_fps,
             'can_rewind': self.can_rewind()
         }
     
     def toggle_step_unit(self) -> str:
         """Toggle between frame-based and time-based stepping."""
         self.step_by_frames = not self.step_by_frames
+        self._invalidate()
         unit = "frames" if self.step_by_frames else "seconds"
         logger.debug(f"Step unit changed to {unit}")
         return unit
@@ -279,6 +384,7 @@ class PhysicsSimulation:
     def set_auto_pause(self, enabled: bool) -> None:
         """Set auto-pause functionality."""
         self.auto_pause_after_step = enabled
+        self._invalidate()
         logger.debug(f"Auto-pause {'enabled' if enabled else 'disabled'}")
     
     def get_ball_position(self) -> Tuple[float, float]:
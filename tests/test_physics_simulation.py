@@ -0,0 +1,234 @@
+"""
+Test suite for the physics_simulation module.
+
+Tests the core PhysicsSimulation time control and history management.
+"""
+
+import unittest
+import sys
+import os
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from physics import Ball, BallState
+from physics_simulation import PhysicsSimulation
+
+
+def step_ball_per_frame(ball: Ball, frame_count: int, dt: float, ground_y: float) -> None:
+    """Reference integration: one update and collision check per frame."""
+    for _ in range(frame_count):
+        if ball.coordinate_system == "screen":
+            ball.update(dt, ground_y)
+            ball.check_ground_collision(ground_y)
+        else:
+            ball.update(dt)
+            ball.check_ground_collision()
+
+
+class TestStepSimulationFrames(unittest.TestCase):
+    """Test cases for frame-based stepping."""
+
+    def assert_matches_reference(self, coordinate_system: str, frame_count: int):
+        """Batched frame stepping should land exactly where per-frame stepping does."""
+        simulation = PhysicsSimulation(800, 600, coordinate_system)
+        reference = Ball(simulation.ball.x, simulation.ball.y, coordinate_system=coordinate_system)
+
+        simulation.step_simulation_frames(frame_count)
+        step_ball_per_frame(reference, frame_count, simulation.dt, simulation.ground_y)
+
+        self.assertEqual(simulation.ball.y, reference.y)
+        self.assertEqual(simulation.ball.velocity_y, reference.velocity_y)
+        self.assertEqual(simulation.ball.acceleration_y, reference.acceleration_y)
+        self.assertAlmostEqual(simulation.simulation_time, frame_count * simulation.dt, places=9)
+
+    def test_free_flight_physics_coordinates(self):
+        """Test stepping that ends before the first bounce."""
+        self.assert_matches_reference("physics", 5)
+
+    def test_bounces_physics_coordinates(self):
+        """Test stepping across several bounces until the ball settles."""
+        self.assert_matches_reference("physics", 60)
+        self.assert_matches_reference("physics", 600)
+
+    def test_bounces_screen_coordinates(self):
+        """Test stepping across bounces with screen coordinates."""
+        self.assert_matches_reference("screen", 5)
+        self.assert_matches_reference("screen", 600)
+
+    def test_matches_playback(self):
+        """Test that stepping frames agrees with playing for the same frames."""
+        for start_y in (250, 300, 420):
+            stepped = PhysicsSimulation(800, 600, "physics")
+            played = PhysicsSimulation(800, 600, "physics")
+            stepped.set_ball_start_position(400, start_y)
+            played.set_ball_start_position(400, start_y)
+
+            stepped.step_simulation_frames(240)
+            played.toggle_play_pause()
+            for _ in range(240):
+                played.update()
+
+            self.assertEqual(stepped.get_ball_position(), played.get_ball_position())
+            self.assertEqual(stepped.get_ball_velocity(), played.get_ball_velocity())
+            self.assertEqual(stepped.simulation_time, played.simulation_time)
+
+    def test_history_records_every_frame(self):
+        """Test that each stepped frame is saved and can be rewound."""
+        simulation = PhysicsSimulation(800, 600, "physics")
+        start_y = simulation.ball.y
+
+        simulation.step_simulation_frames(90)
+        self.assertEqual(simulation.get_history_info()['frames_stored'], 90)
+
+        simulation.step_simulation_frames(-89)
+        self.assertAlmostEqual(simulation.simulation_time, 0.0)
+        self.assertEqual(simulation.ball.y, start_y)
+
+    def test_playback_records_every_frame(self):
+        """Test that each played frame is saved to history."""
+        simulation = PhysicsSimulation(800, 600, "physics")
+        simulation.toggle_play_pause()
+
+        for frame in range(1, 31):
+            simulation.update()
+            self.assertEqual(simulation.get_history_info()['frames_stored'], frame)
+
+    def test_history_keeps_newest_frames(self):
+        """Test that stepping past the history limit keeps the newest frames."""
+        simulation = PhysicsSimulation(800, 600, "physics")
+        max_frames = simulation.get_history_info()['max_frames']
+
+        simulation.step_simulation_frames(max_frames + 25)
+
+        self.assertEqual(simulation.get_history_info()['frames_stored'], max_frames)
+        simulation.step_simulation_frames(-1)
+        self.assertAlmostEqual(simulation.simulation_time, (max_frames + 23) * simulation.dt, places=6)
+
+
+class TestStepSimulationTime(unittest.TestCase):
+    """Test cases for time-based stepping."""
+
+    def test_matches_per_step_reference(self):
+        """Test that stepping by time matches clamping each step to the target."""
+        for coordinate_system in ("physics", "screen"):
+            for time_step in (0.004, 1.0, 2.5, 7.31):
+                simulation = PhysicsSimulation(800, 600, coordinate_system)
+                reference = Ball(simulation.ball.x, simulation.ball.y,
+                                 coordinate_system=coordinate_system)
+
+                simulation.step_simulation_time(time_step)
+
+                reference_time = 0.0
+                while reference_time < time_step:
+                    current_dt = min(simulation.dt, time_step - reference_time)
+                    step_ball_per_frame(reference, 1, current_dt, simulation.ground_y)
+                    reference_time += current_dt
+
+                self.assertEqual(simulation.ball.y, reference.y)
+                self.assertEqual(simulation.ball.velocity_y, reference.velocity_y)
+                self.assertEqual(simulation.simulation_time, reference_time)
+
+
+class TestRewindToTime(unittest.TestCase):
+    """Test cases for rewinding to the closest saved time."""
+
+    def test_rewinds_to_closest_frame(self):
+        """Test that rewinding picks the nearest saved frame."""
+        simulation = PhysicsSimulation(800, 600, "physics")
+        simulation.step_simulation_frames(40)
+        saved_time = simulation.simulation_time
+        simulation.step_simulation_frames(80)
+
+        simulation.rewind_to_time(saved_time + simulation.dt * 0.4)
+
+        self.assertEqual(simulation.simulation_time, saved_time)
+        self.assertEqual(simulation.get_history_info()['frames_stored'], 41)
+
+    def test_rewinds_across_wrapped_history(self):
+        """Test that the search covers both halves of a full history buffer."""
+        max_frames = PhysicsSimulation(800, 600, "physics").get_history_info()['max_frames']
+        total_frames = max_frames + max_frames // 2
+        oldest_frame = total_frames - max_frames
+
+        # Once wrapped, the oldest frame sits mid-buffer: index 10 is in the
+        # run up to the end of the buffer, the other index past the wrap
+        for index in (10, max_frames // 2 + 10):
+            simulation = PhysicsSimulation(800, 600, "physics")
+            simulation.step_simulation_frames(oldest_frame + index)
+            saved_time = simulation.simulation_time
+            simulation.step_simulation_frames(total_frames - oldest_frame - index)
+
+            simulation.rewind_to_time(saved_time - simulation.dt * 0.4)
+
+            self.assertEqual(simulation.simulation_time, saved_time)
+            self.assertEqual(simulation.get_history_info()['frames_stored'], index + 1)
+
+
+class TestBallSnapshot(unittest.TestCase):
+    """Test cases for ball snapshots used by history."""
+
+    def test_snapshot_round_trip(self):
+        """Test that restoring a snapshot brings back the ball's motion."""
+        ball = Ball(400, 300, coordinate_system="physics")
+        ball.update(0.05)
+        snapshot = ball.snapshot()
+        self.assertIsInstance(snapshot, BallState)
+
+        ball.update(0.05)
+        ball.restore(snapshot)
+
+        self.assertEqual(ball.snapshot(), snapshot)
+        self.assertEqual(ball.y, snapshot.y)
+        self.assertEqual(ball.velocity_y, snapshot.velocity_y)
+
+
+class TestGetState(unittest.TestCase):
+    """Test cases for the cached simulation state."""
+
+    def test_state_reused_until_changed(self):
+        """Test that get_state is only rebuilt after the simulation changes."""
+        simulation = PhysicsSimulation(800, 600, "physics")
+        state = simulation.get_state()
+        time_before = state['time']
+
+        self.assertIs(simulation.get_state(), state)
+
+        simulation.step_simulation_frames(3)
+        self.assertAlmostEqual(simulation.get_state()['time'], time_before + 3 * simulation.dt)
+        self.assertEqual(simulation.get_state()['ball']['y'], simulation.ball.y)
+
+    def test_returned_state_not_modified(self):
+        """Test that a state already returned keeps its values after the simulation changes."""
+        simulation = PhysicsSimulation(800, 600, "physics")
+        state = simulation.get_state()
+        ball_y = state['ball']['y']
+        total_energy = state['energy']['total']
+
+        simulation.step_simulation_frames(10)
+        simulation.toggle_play_pause()
+        simulation.get_state()
+
+        self.assertEqual(state['time'], 0.0)
+        self.assertFalse(state['is_playing'])
+        self.assertEqual(state['ball']['y'], ball_y)
+        self.assertEqual(state['energy']['total'], total_energy)
+
+    def test_toggles_refresh_state(self):
+        """Test that control toggles show up in the next state."""
+        simulation = PhysicsSimulation(800, 600, "physics")
+        simulation.get_state()
+
+        simulation.toggle_play_pause()
+        simulation.toggle_step_unit()
+        simulation.set_auto_pause(False)
+
+        state = simulation.get_state()
+        self.assertTrue(state['is_playing'])
+        self.assertTrue(state['step_by_frames'])
+        self.assertFalse(state['auto_pause_after_step'])
+
+
+if __name__ == '__main__':
+    # Run the tests
+    unittest.main()